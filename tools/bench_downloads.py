@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+import os
+import re
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import http.server
+import socketserver
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yanix_launcher.net import download_file
+
+SEND_CHUNK_SIZE = 64 * 1024
+
+class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    payload = b""
+    rate = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_payload(head=True)
+
+    def do_GET(self):
+        self.send_payload()
+
+    def send_payload(self, head=False):
+        size = len(self.payload)
+        start, end = 0, size - 1
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"bench"')
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if head:
+            return
+
+        began = time.monotonic()
+        sent = 0
+        view = memoryview(self.payload)
+        try:
+            for offset in range(start, end + 1, SEND_CHUNK_SIZE):
+                chunk = view[offset:min(offset + SEND_CHUNK_SIZE, end + 1)]
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if self.rate:
+                    delay = sent / self.rate - (time.monotonic() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+class BenchmarkServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+def start_server(payload, rate):
+    handler = type("Handler", (RangeRequestHandler,), {"payload": payload, "rate": rate})
+    server = BenchmarkServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/payload.bin"
+
+def report_progress(downloaded_size, total_size):
+    return f"{downloaded_size / (1024 * 1024):.1f}MB / {total_size / (1024 * 1024):.1f}MB"
+
+def legacy_download(url, dest_path):
+    response = requests.get(url, stream=True, timeout=10)
+    response.raise_for_status()
+    total_size = int(response.headers.get('content-length', 0))
+    downloaded_size = 0
+    with open(dest_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+            downloaded_size += len(chunk)
+            report_progress(downloaded_size, total_size)
+
+def run_case(name, download, url, size, repeat, work_dir):
+    timings = []
+    for _ in range(repeat):
+        dest_path = os.path.join(work_dir, f"{name}.bin")
+        began = time.perf_counter()
+        download(url, dest_path)
+        timings.append(time.perf_counter() - began)
+        if os.path.getsize(dest_path) != size:
+            raise RuntimeError(f"{name}: incomplete download")
+        os.remove(dest_path)
+    best = min(timings)
+    print(f"{name:<16} {best:8.3f}s {size / best / (1024 * 1024):10.1f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark launcher downloads against a local range-capable HTTP server.")
+    parser.add_argument("--size", type=int, default=128, help="payload size in MB")
+    parser.add_argument("--rate", type=float, default=0, help="per-connection rate limit in MB/s (0 = unlimited)")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    size = args.size * 1024 * 1024
+    server, url = start_server(os.urandom(size), int(args.rate * 1024 * 1024))
+    cases = {
+        "legacy loop": legacy_download,
+        "single": lambda url, dest_path: download_file(url, dest_path, report_progress, connections=1),
+        f"segmented x{args.connections}": lambda url, dest_path: download_file(url, dest_path, report_progress, connections=args.connections),
+    }
+    print(f"payload {args.size} MB, per-connection limit {args.rate or 'none'}{' MB/s' if args.rate else ''}")
+    try:
+        with tempfile.TemporaryDirectory(prefix="yanix-bench-") as work_dir:
+            for name, download in cases.items():
+                run_case(name, download, url, size, args.repeat, work_dir)
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+import os
+import sys
+import time
+import shutil
+import zipfile
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from yanix_launcher.config import EXTRACT_WORKERS
+from yanix_launcher.install import extract_archive
+
+def build_archive(zip_path, entries, size):
+    entry_size = max(1, size // entries)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        for i in range(entries):
+            if i % 2:
+                data = os.urandom(entry_size)
+            else:
+                data = (os.urandom(64) * (entry_size // 64 + 1))[:entry_size]
+            zip_ref.writestr(f"Game/YandereSimulator_Data/dir{i % 16}/asset{i}.bin", data)
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+    return len(infos), sum(info.file_size for info in infos)
+
+def serial_extract(zip_path, target_folder):
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(target_folder)
+
+def run_case(name, extract, zip_path, entries, size, repeat, work_dir):
+    timings = []
+    for _ in range(repeat):
+        target_folder = os.path.join(work_dir, "out")
+        began = time.perf_counter()
+        extract(zip_path, target_folder)
+        timings.append(time.perf_counter() - began)
+        shutil.rmtree(target_folder)
+    best = min(timings)
+    print(f"{name:<16} {best:8.3f}s {entries / best:10.0f} entries/s {size / best / (1024 * 1024):8.1f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark archive extraction, serial extractall vs the launcher's parallel extractor.")
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=256, help="uncompressed archive size in MB")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 4, EXTRACT_WORKERS}))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = {"extractall": serial_extract}
+    for workers in args.workers:
+        cases[f"parallel x{workers}"] = lambda zip_path, target_folder, workers=workers: extract_archive(zip_path, target_folder, workers=workers)
+
+    with tempfile.TemporaryDirectory(prefix="yanix-bench-") as work_dir:
+        zip_path = os.path.join(work_dir, "archive.zip")
+        entries, size = build_archive(zip_path, args.entries, args.size * 1024 * 1024)
+        print(f"{entries} entries, {size / (1024 * 1024):.0f} MB uncompressed, {os.path.getsize(zip_path) / (1024 * 1024):.0f} MB compressed, {os.cpu_count()} CPUs")
+        for name, extract in cases.items():
+            run_case(name, extract, zip_path, entries, size, args.repeat, work_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+import os
+import json
+import platform
+import threading
+import functools
+from collections.abc import Mapping
+
+from . import __version__
+from .profiling import startup_profiler
+
+IS_WINDOWS = platform.system() == 'Windows'
+IS_MACOS = platform.system() == 'Darwin'
+
+CLIENT_ID = '1383809366460989490'
+USER_AGENT = f'YanixLauncher/{__version__}'
+
+if IS_WINDOWS:
+    YANIX_PATH = os.path.join(os.getenv('LOCALAPPDATA'), 'yanix-launcher')
+else:
+    YANIX_PATH = os.path.expanduser("~/.local/share/yanix-launcher")
+
+DATA_DOWNLOAD_URL = "https://theofficialdt.github.io/data.zip"
+BACKGROUNDS_DOWNLOAD_URL = "https://theofficialdt.github.io/downloads/yorkipoo/backgrounds/backgrounds.zip"
+PADMODE_DOWNLOAD_URL = "https://theofficialdt.github.io/downloads/padmode.py"
+LATEST_VERSION_URL = "https://raw.githubusercontent.com/theofficialdt/yanix-launcher/refs/heads/main/yanix_launcher/__init__.py"
+LATEST_PACKAGE_URL = "https://github.com/theofficialdt/yanix-launcher/archive/refs/heads/main.zip"
+
+ARCHIVE_CACHE_DIR = os.path.join(YANIX_PATH, "cache")
+NEWS_CACHE_DIR = os.path.join(YANIX_PATH, "news")
+BLOG_PROFILE_DIR = os.path.join(YANIX_PATH, "blog-profile")
+ENVIRONMENT_CACHE_FILE = os.path.join(YANIX_PATH, "environment.json")
+ASSET_MANIFEST_DIR = os.path.join(YANIX_PATH, "manifests")
+VERSIONS_DIR = os.path.join(YANIX_PATH, "versions")
+ACTIVE_VERSION_FILE = os.path.join(VERSIONS_DIR, "current")
+PACKAGE_NAME = "yanix_launcher"
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations")
+FALLBACK_LANGUAGE = "en"
+ARCHIVE_CACHE_MAX_SIZE = 8 * 1024 * 1024 * 1024
+
+HTTP_TIMEOUT = (10, 30)
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_POOL_SIZE = 16
+CONNECTIVITY_TTL = 30
+CONNECTIVITY_TIMEOUT = 3
+CONNECTIVITY_FALLBACK_TARGET = ("8.8.8.8", 53)
+ENVIRONMENT_PROBE_TIMEOUT = 60
+WINE_PROBE_ENV = ("WINEPREFIX", "WINEARCH", "WINELOADER")
+GLXINFO_PROBE_ENV = ("DISPLAY", "WAYLAND_DISPLAY", "LIBGL_ALWAYS_SOFTWARE", "GALLIUM_DRIVER", "MESA_LOADER_DRIVER_OVERRIDE", "__GLX_VENDOR_LIBRARY_NAME", "DRI_PRIME")
+GL_DRIVER_PATHS = (
+    "/usr/lib/dri", "/usr/lib64/dri", "/usr/lib/x86_64-linux-gnu/dri", "/usr/lib/i386-linux-gnu/dri",
+    "/usr/lib/libGLX_mesa.so.0", "/usr/lib64/libGLX_mesa.so.0", "/usr/lib/x86_64-linux-gnu/libGLX_mesa.so.0",
+    "/usr/lib/libGLX_nvidia.so.0", "/usr/lib64/libGLX_nvidia.so.0", "/usr/lib/x86_64-linux-gnu/libGLX_nvidia.so.0",
+    "/usr/share/glvnd/egl_vendor.d", "/etc/X11/xorg.conf.d"
+)
+DRM_CLASS_DIR = "/sys/class/drm"
+CHECKSUM_SUFFIX = ".sha256"
+PROGRESS_REFRESH_MS = 100
+SPLASH_FRAME_INTERVAL_MS = 33
+THEME_CACHE_SIZE = 8
+WINDOW_SIZE = (1100, 600)
+BACKGROUND_SCALE_RATIOS = (1, 1.25, 1.5, 2)
+BACKGROUND_DERIVATIVE_FORMAT = "jpg"
+BACKGROUND_DERIVATIVE_QUALITY = 90
+PROGRESS_SMOOTHING = 0.3
+
+RESUME_STATE_SUFFIX = ".resume"
+RESUME_STATE_INTERVAL = 1024 * 1024
+DOWNLOAD_CONNECTIONS = 4
+SEGMENTED_MIN_SIZE = 8 * 1024 * 1024
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+DOWNLOAD_BUFFER_COUNT = 8
+SEGMENT_BUFFER_COUNT = 4
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_QUEUE_SIZE = 64
+RANGE_READ_AHEAD = 256 * 1024
+NEWS_CACHE_TTL = 15 * 60
+BLOG_HTTP_CACHE_SIZE = 64 * 1024 * 1024
+NEWS_MAX_POSTS = 20
+NEWS_SUMMARY_LENGTH = 280
+NEWS_THUMBNAIL_SIZE = 72
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+STARTUP_WORKERS = 4
+
+CONFIG_FILE = os.path.join(YANIX_PATH, "config.json")
+ICON_PATH = os.path.join(YANIX_PATH, "data/yanix.png")
+CUSTOM_THEMES_DIR = os.path.join(YANIX_PATH, "themes")
+BACKGROUNDS_DIR = os.path.join(YANIX_PATH, "backgrounds")
+PADMODE_DIR = os.path.join(YANIX_PATH, "padmode")
+PADMODE_SCRIPT_PATH = os.path.join(PADMODE_DIR, "padmode.py")
+JOST_FONT_PATH = os.path.join(YANIX_PATH, "data/Font/Jost.ttf")
+
+YAN_SIM_DOWNLOAD_URL = "https://yanderesimulator.com/dl/latest.zip"
+YAN_SIM_INSTALL_PATH = os.path.join(YANIX_PATH, "game")
+YAN_SIM_EXE_NAME = "YandereSimulator.exe"
+YAN_SIM_NATIVE_EXE_PATH = os.path.join(YAN_SIM_INSTALL_PATH, YAN_SIM_EXE_NAME)
+
+os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+os.makedirs(CUSTOM_THEMES_DIR, exist_ok=True)
+os.makedirs(BACKGROUNDS_DIR, exist_ok=True)
+os.makedirs(PADMODE_DIR, exist_ok=True)
+
+startup_profiler.begin("build_literals")
+
+DEFAULT_CONFIG = {
+    "language": "en",
+    "theme": "ferret-christmas",
+    "game_path": "",
+    "wine_prefix": "",
+    "advanced_mode": False,
+    "blog_link": "https://yanix-launcher.blogspot.com",
+    "lite_news": False,
+    "low_footprint_tray": True,
+    "discord_rpc": True,
+    "launch_command": "",
+    "gamemode": False,
+    "fsr": False,
+    "stream_install": False,
+    "download_buffer_size": DOWNLOAD_BUFFER_SIZE,
+    "first_run": True
+}
+
+class Translation(dict):
+    def __init__(self, entries, fallback=None):
+        super().__init__(entries)
+        self.fallback = fallback
+
+    def __missing__(self, key):
+        if self.fallback is None:
+            raise KeyError(key)
+        value = self.fallback()[key]
+        self[key] = value
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+class TranslationCatalogs(Mapping):
+    def __init__(self, translations_dir, fallback_language=FALLBACK_LANGUAGE):
+        self.translations_dir = translations_dir
+        self.fallback_language = fallback_language
+        self.lock = threading.Lock()
+        self.catalogs = {}
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.translations_dir, "index.json"), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading translation index: {e}")
+            return {self.fallback_language: f"{self.fallback_language}.json"}
+
+    def _load_catalog(self, code):
+        try:
+            with open(os.path.join(self.translations_dir, self.index[code]), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading translations for {code}: {e}")
+            entries = {}
+        if code == self.fallback_language:
+            return Translation(entries)
+        return Translation(entries, functools.partial(self.__getitem__, self.fallback_language))
+
+    def __getitem__(self, code):
+        if code not in self.index:
+            raise KeyError(code)
+        with self.lock:
+            catalog = self.catalogs.get(code)
+            if catalog is None:
+                catalog = self.catalogs[code] = self._load_catalog(code)
+        return catalog
+
+    def __contains__(self, code):
+        return code in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+LANGUAGES = TranslationCatalogs(TRANSLATIONS_DIR)
+
+THEMES = {
+    "dragon-red": {
+        "background_color_start": "#660000",
+        "background_color_end": "#000000",
+        "button_bg_color": "#CC0000",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#FF3333",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#990000"
+    },
+    "dragon-blue": {
+        "background_color_start": "#000033",
+        "background_color_end": "#000000",
+        "button_bg_color": "#003366",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#004C99",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#336699"
+    },
+    "dragon-white": {
+        "background_color_start": "#FFFFFF",
+        "background_color_end": "#E0E0E0",
+        "button_bg_color": "#D3D3D3",
+        "button_text_color": "#000000",
+        "button_hover_bg_color": "#BEBEBE",
+        "label_text_color": "#000000",
+        "border_color": "#A9A9A9"
+    },
+    "dragon-dark": {
+        "background_color_start": "#1a1a1a",
+        "background_color_end": "#000000",
+        "button_bg_color": "#4d4d4d",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#666666",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#808080"
+    },
+    "yanix-legacy": {
+        "background_color_start": "#ff4da6",
+        "background_color_end": "#6666ff",
+        "button_bg_color": "white",
+        "button_text_color": "black",
+        "button_hover_bg_color": "#f0f0f0",
+        "label_text_color": "white",
+        "border_color": "#ccc"
+    },
+    "dark": {
+        "background_color_start": "#333333",
+        "background_color_end": "#1a1a1a",
+        "button_bg_color": "#555555",
+        "button_text_color": "white",
+        "button_hover_bg_color": "#777777",
+        "label_text_color": "white",
+        "border_color": "#666666"
+    },
+    "light": {
+        "background_color_start": "#f0f0f0",
+        "background_color_end": "#ffffff",
+        "button_bg_color": "#e0e0e0",
+        "button_text_color": "black",
+        "button_hover_bg_color": "#cccccc",
+        "label_text_color": "black",
+        "border_color": "#aaaaaa"
+    },
+    "flowers-pink": {
+        "background_color_start": "#D5006D",
+        "background_color_end": "#2A0015",
+        "button_bg_color": "#FF1493",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#FF69B4",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#C71585"
+    },
+    "flowers-red": {
+        "background_color_start": "#8B0000",
+        "background_color_end": "#1a0505",
+        "button_bg_color": "#DC143C",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#FF4500",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#B22222"
+    },
+    "yorkipoo-silver": {
+        "background_image": os.path.join(BACKGROUNDS_DIR, "ys.png"),
+        "button_bg_color": "#C0C0C0",
+        "button_text_color": "#000000",
+        "button_hover_bg_color": "#D3D3D3",
+        "label_text_color": "#000000",
+        "border_color": "#A9A9A9"
+    },
+    "yorkipoo-chocolate": {
+        "background_image": os.path.join(BACKGROUNDS_DIR, "yc.png"),
+        "button_bg_color": "#D2691E",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#CD853F",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#8B4513"
+    },
+    "yorkipoo-beige": {
+        "background_image": os.path.join(BACKGROUNDS_DIR, "yb.png"),
+        "button_bg_color": "#F5F5DC",
+        "button_text_color": "#000000",
+        "button_hover_bg_color": "#EEE8AA",
+        "label_text_color": "#000000",
+        "border_color": "#BDB76B"
+    },
+    "ferret-tan-and-black": {
+        "background_color_start": "#D2B48C",
+        "background_color_end": "#000000",
+        "button_bg_color": "#D2B48C",
+        "button_text_color": "#000000",
+        "button_hover_bg_color": "#C3A57D",
+        "label_text_color": "#FFFFFF",
+        "border_color": "#8B4513"
+    },
+    "ferret-beige": {
+        "background_color_start": "#F5F5DC",
+        "background_color_end": "#EEE8AA",
+        "button_bg_color": "#F5F5DC",
+        "button_text_color": "#000000",
+        "button_hover_bg_color": "#E6E6CA",
+        "label_text_color": "#000000",
+        "border_color": "#BDB76B"
+    },
+    "ferret-christmas": {
+        "background_color_start": "#144722",
+        "background_color_end": "#680C0E",
+        "button_bg_color": "#B2181C",
+        "button_text_color": "#FFFFFF",
+        "button_hover_bg_color": "#206935",
+        "label_text_color": "#F8B229",
+        "border_color": "#F8B229"
+    }
+}
+
+startup_profiler.end("build_literals")
+
+def load_config():
+    if not os.path.exists(CONFIG_FILE):
+        return DEFAULT_CONFIG.copy()
+    try:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        
+        merged_config = DEFAULT_CONFIG.copy()
+        merged_config.update(config)
+        return merged_config
+    except (json.JSONDecodeError, IOError):
+        return DEFAULT_CONFIG.copy()
+
+def save_config(config):
+    try:
+        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=4)
+    except IOError as e:
+        print(f"Error saving config: {e}")
+
+def handle_first_run(config):
+    if config.get("first_run", True):
+        config["first_run"] = False
+        save_config(config)
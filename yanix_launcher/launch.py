@@ -0,0 +1,177 @@
+import os
+import gc
+import ctypes
+import shutil
+import subprocess
+import threading
+import json
+import re
+import functools
+import warnings
+
+from .config import (
+    IS_WINDOWS, YAN_SIM_NATIVE_EXE_PATH, ENVIRONMENT_CACHE_FILE, ENVIRONMENT_PROBE_TIMEOUT,
+    WINE_PROBE_ENV, GLXINFO_PROBE_ENV, GL_DRIVER_PATHS, DRM_CLASS_DIR
+)
+
+warnings.filterwarnings("ignore", category=RuntimeWarning, message="coroutine 'BaseClient.read_output' was never awaited")
+
+def parse_wine_version(output):
+    match = re.search(r'([0-9]+)\.([0-9]+)', output)
+    return f"{match.group(1)}.{match.group(2)}" if match else None
+
+def parse_software_renderer(output):
+    output = output.lower()
+    return "llvmpipe" in output or "softpipe" in output
+
+class EnvironmentCache:
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _save(self, cache):
+        try:
+            with open(self.cache_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=4)
+            os.replace(self.cache_path + ".tmp", self.cache_path)
+        except OSError as e:
+            print(f"Error saving environment cache: {e}")
+
+    def fingerprint(self, binary_path, env_vars):
+        stat = os.stat(binary_path)
+        return {
+            "path": binary_path,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "env": {var: os.environ.get(var) for var in env_vars}
+        }
+
+    def probe(self, name, command, env_vars, parse, system_state=None):
+        binary_path = shutil.which(command[0])
+        if not binary_path:
+            return None
+        try:
+            key = self.fingerprint(os.path.realpath(binary_path), env_vars)
+        except OSError:
+            return None
+        if system_state:
+            key["system"] = system_state()
+
+        with self.lock:
+            entry = self._load().get(name)
+        if entry and entry.get("key") == key:
+            return entry.get("result")
+
+        try:
+            result = subprocess.run([binary_path] + command[1:], capture_output=True, text=True, timeout=ENVIRONMENT_PROBE_TIMEOUT)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Error probing {command[0]}: {e}")
+            return None
+        value = parse(result.stdout)
+
+        with self.lock:
+            cache = self._load()
+            cache[name] = {"key": key, "result": value}
+            self._save(cache)
+        return value
+
+environment_cache = EnvironmentCache(ENVIRONMENT_CACHE_FILE)
+
+def probe_wine_version():
+    return environment_cache.probe("wine", ["wine", "--version"], WINE_PROBE_ENV, parse_wine_version)
+
+def gl_driver_state():
+    state = {}
+    for path in GL_DRIVER_PATHS:
+        try:
+            state[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    try:
+        devices = sorted(os.listdir(DRM_CLASS_DIR))
+    except OSError:
+        devices = []
+    drivers = {}
+    for device in devices:
+        try:
+            drivers[device] = os.path.basename(os.readlink(os.path.join(DRM_CLASS_DIR, device, "device", "driver")))
+        except OSError:
+            drivers[device] = None
+    state["drm"] = drivers
+    return state
+
+def probe_software_rendering():
+    return environment_cache.probe("glxinfo", ["glxinfo", "-B"], GLXINFO_PROBE_ENV, parse_software_renderer, gl_driver_state)
+
+@functools.lru_cache(maxsize=None)
+def load_presence():
+    try:
+        from pypresence import Presence
+    except ImportError:
+        return None
+    return Presence
+
+def resolve_game_executable(config):
+    wine_path_exe = config.get("game_path")
+    if wine_path_exe and os.path.exists(wine_path_exe):
+        return wine_path_exe
+    if os.path.exists(YAN_SIM_NATIVE_EXE_PATH):
+        return YAN_SIM_NATIVE_EXE_PATH
+    return None
+
+def build_game_command(config, wine_path_exe):
+    cmd_prefix = []
+    
+    if not IS_WINDOWS and config.get("gamemode", False) and shutil.which("gamemoderun"):
+        cmd_prefix.append("gamemoderun")
+
+    if IS_WINDOWS:
+        base_game_command = [wine_path_exe]
+    else:
+        base_game_command = ["wine", wine_path_exe]
+    
+    final_base = cmd_prefix + base_game_command
+
+    custom_command_str = config.get("launch_command", "").strip()
+    final_command = []
+
+    if custom_command_str:
+        if "%LC%" in custom_command_str:
+            parts = custom_command_str.split()
+            for part in parts:
+                if part == "%LC%":
+                    final_command.extend(final_base)
+                else:
+                    final_command.append(part)
+        else:
+            final_command = custom_command_str.split()
+    else:
+        final_command = final_base
+    return final_command
+
+def build_game_env(config):
+    env = os.environ.copy()
+    if not IS_WINDOWS:
+        if config.get("wine_prefix"):
+            env["WINEPREFIX"] = config["wine_prefix"]
+        if config.get("fsr", False):
+            env["WINE_FULLSCREEN_FSR"] = "1"
+    return env
+
+def trim_process_memory():
+    gc.collect()
+    try:
+        if IS_WINDOWS:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetProcessWorkingSetSize(kernel32.GetCurrentProcess(), ctypes.c_size_t(-1), ctypes.c_size_t(-1))
+        else:
+            ctypes.CDLL(None).malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
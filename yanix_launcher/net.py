@@ -0,0 +1,640 @@
+import os
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import socket
+import urllib.parse
+import json
+import re
+import hashlib
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .config import (
+    USER_AGENT, ARCHIVE_CACHE_DIR, ARCHIVE_CACHE_MAX_SIZE, HTTP_TIMEOUT, HTTP_RETRIES, HTTP_RETRY_BACKOFF,
+    HTTP_POOL_SIZE, CONNECTIVITY_TTL, CONNECTIVITY_TIMEOUT, CONNECTIVITY_FALLBACK_TARGET, CHECKSUM_SUFFIX,
+    RESUME_STATE_SUFFIX, RESUME_STATE_INTERVAL, SEGMENTED_MIN_SIZE, DOWNLOAD_BUFFER_SIZE, DOWNLOAD_BUFFER_COUNT,
+    SEGMENT_BUFFER_COUNT, STREAM_CHUNK_SIZE, RANGE_READ_AHEAD
+)
+
+def probe_target(url):
+    if not url:
+        return CONNECTIVITY_FALLBACK_TARGET
+    parsed = urllib.parse.urlsplit(url)
+    return parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80)
+
+class ConnectivityMonitor:
+    def __init__(self, ttl=CONNECTIVITY_TTL, timeout=CONNECTIVITY_TIMEOUT):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.results = {}
+        self.probes = {}
+
+    def _probe(self, target, done):
+        try:
+            socket.create_connection(target, timeout=self.timeout).close()
+            online = True
+        except OSError:
+            online = False
+        with self.lock:
+            self.results[target] = (online, time.monotonic())
+            del self.probes[target]
+        done.set()
+
+    def refresh(self, url=None):
+        target = probe_target(url)
+        with self.lock:
+            done = self.probes.get(target)
+            if done is None:
+                done = threading.Event()
+                self.probes[target] = done
+                threading.Thread(target=self._probe, args=(target, done), daemon=True).start()
+        return done
+
+    def is_online(self, url=None, wait=True):
+        target = probe_target(url)
+        with self.lock:
+            result = self.results.get(target)
+        if result and result[1] is not None and time.monotonic() - result[1] < self.ttl:
+            return result[0]
+        done = self.refresh(url)
+        if not wait:
+            return None
+        done.wait()
+        with self.lock:
+            return self.results[target][0]
+
+    def report(self, url, reachable):
+        target = probe_target(url)
+        with self.lock:
+            if reachable:
+                self.results[target] = (True, time.monotonic())
+            elif target in self.results:
+                self.results[target] = (self.results[target][0], None)
+
+connectivity = ConnectivityMonitor()
+
+def check_internet_connection(url=None):
+    return connectivity.is_online(url)
+
+class MonitoredHTTPAdapter(HTTPAdapter):
+    def send(self, request, *args, **kwargs):
+        try:
+            response = super().send(request, *args, **kwargs)
+        except requests.ConnectionError:
+            connectivity.report(request.url, False)
+            raise
+        connectivity.report(request.url, True)
+        return response
+
+http_session = None
+http_session_lock = threading.Lock()
+
+def get_http_session():
+    global http_session
+    with http_session_lock:
+        if http_session is None:
+            retry = Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False
+            )
+            adapter = MonitoredHTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({'User-Agent': USER_AGENT})
+            http_session = session
+        return http_session
+
+def _resume_state_path(dest_path):
+    return dest_path + RESUME_STATE_SUFFIX
+
+def load_resume_state(dest_path, url):
+    state_path = _resume_state_path(dest_path)
+    if not (os.path.exists(state_path) and os.path.exists(dest_path)):
+        return None
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+    if state.get("url") != url or not (state.get("etag") or state.get("last_modified")):
+        return None
+
+    if "segments" in state:
+        if os.path.getsize(dest_path) != state.get("total"):
+            return None
+        return state
+
+    downloaded = min(int(state.get("downloaded", 0)), os.path.getsize(dest_path))
+    if downloaded <= 0:
+        return None
+    if os.path.getsize(dest_path) != downloaded:
+        with open(dest_path, 'r+b') as f:
+            f.truncate(downloaded)
+    state["downloaded"] = downloaded
+    return state
+
+def save_resume_state(dest_path, state):
+    state_path = _resume_state_path(dest_path)
+    try:
+        with open(state_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(state_path + ".tmp", state_path)
+    except OSError as e:
+        print(f"Error saving download state: {e}")
+
+def clear_resume_state(dest_path, remove_partial=False):
+    paths = [_resume_state_path(dest_path)]
+    if remove_partial:
+        paths.append(dest_path)
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+class ChecksumMismatchError(Exception):
+    pass
+
+def hash_file_range(hasher, path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(1024 * 1024, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            remaining -= len(block)
+
+def fetch_published_checksum(url, timeout=HTTP_TIMEOUT):
+    try:
+        response = get_http_session().get(url + CHECKSUM_SUFFIX, timeout=timeout)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    match = re.search(r'\b[0-9a-fA-F]{64}\b', response.text)
+    return match.group(0).lower() if match else None
+
+def _range_validator(etag, last_modified):
+    if etag and not etag.startswith("W/"):
+        return etag
+    return last_modified or etag
+
+def fetch_resource_info(url, timeout=HTTP_TIMEOUT):
+    try:
+        response = get_http_session().head(url, allow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    return {
+        "size": int(response.headers.get('content-length', 0)),
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+        "ranges": response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+    }
+
+def probe_range_support(url, timeout=HTTP_TIMEOUT):
+    info = fetch_resource_info(url, timeout)
+    if not info or not info["ranges"] or info["size"] <= 0:
+        return None
+    return info["size"], info["etag"], info["last_modified"]
+
+class HttpRangeFile:
+    def __init__(self, url, size, etag=None, last_modified=None, read_ahead=RANGE_READ_AHEAD, timeout=HTTP_TIMEOUT):
+        self.url = url
+        self.size = size
+        self.validator = _range_validator(etag, last_modified)
+        self.read_ahead = read_ahead
+        self.timeout = timeout
+        self.position = 0
+        self.buffer_start = 0
+        self.buffer = b""
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self.position
+        size = min(size, self.size - self.position)
+        if size <= 0:
+            return b""
+        offset = self.position - self.buffer_start
+        if offset < 0 or offset + size > len(self.buffer):
+            self._fill(self.position, max(size, self.read_ahead))
+            offset = 0
+        data = self.buffer[offset:offset + size]
+        self.position += len(data)
+        return data
+
+    def _fill(self, start, length):
+        end = min(self.size, start + length) - 1
+        headers = {'Range': f'bytes={start}-{end}'}
+        if self.validator:
+            headers['If-Range'] = self.validator
+        with get_http_session().get(self.url, stream=True, timeout=self.timeout, headers=headers) as response:
+            if response.status_code != 206:
+                raise requests.HTTPError(f"Range request for {self.url} returned {response.status_code}", response=response)
+            self.buffer = response.content
+        self.buffer_start = start
+
+    def close(self):
+        self.buffer = b""
+
+def split_segments(total_size, connections):
+    segment_size = -(-total_size // connections)
+    return [[start, min(start + segment_size, total_size) - 1, 0] for start in range(0, total_size, segment_size)]
+
+def preallocate_file(f, size):
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    if os.fstat(f.fileno()).st_size < size:
+        f.truncate(size)
+
+class DownloadWriter:
+    def __init__(self, path, offset=0, preallocate_size=0, truncate=False, hasher=None,
+                 buffer_size=DOWNLOAD_BUFFER_SIZE, buffer_count=DOWNLOAD_BUFFER_COUNT):
+        mode = 'wb' if truncate or not os.path.exists(path) else 'r+b'
+        self.file = open(path, mode, buffering=0)
+        if preallocate_size > 0:
+            preallocate_file(self.file, preallocate_size)
+        self.file.seek(offset)
+        self.hasher = hasher
+        self.free_buffers = queue.Queue()
+        for _ in range(buffer_count):
+            self.free_buffers.put(bytearray(buffer_size))
+        self.filled_buffers = queue.Queue()
+        self.buffer = self.free_buffers.get()
+        self.buffer_used = 0
+        self.written = 0
+        self.error = None
+        self.thread = threading.Thread(target=self._drain, daemon=True)
+        self.thread.start()
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            if self.error:
+                raise self.error
+            take = min(len(self.buffer) - self.buffer_used, len(view))
+            self.buffer[self.buffer_used:self.buffer_used + take] = view[:take]
+            self.buffer_used += take
+            view = view[take:]
+            if self.buffer_used == len(self.buffer):
+                self._submit()
+
+    def _submit(self):
+        if self.buffer_used:
+            self.filled_buffers.put((self.buffer, self.buffer_used))
+            self.buffer = self.free_buffers.get()
+            self.buffer_used = 0
+
+    def _drain(self):
+        while True:
+            item = self.filled_buffers.get()
+            if item is None:
+                return
+            buffer, length = item
+            try:
+                if self.error is None:
+                    view = memoryview(buffer)[:length]
+                    while view:
+                        view = view[self.file.write(view):]
+                    if self.hasher:
+                        self.hasher.update(memoryview(buffer)[:length])
+                    self.written += length
+            except Exception as e:
+                self.error = e
+            finally:
+                self.free_buffers.put(buffer)
+
+    def close(self):
+        try:
+            self._submit()
+            self.filled_buffers.put(None)
+            self.thread.join()
+        finally:
+            self.file.close()
+        if self.error:
+            raise self.error
+
+def _download_stream(url, dest_path, state, progress_callback, is_running, resume, timeout, buffer_size):
+    headers = {}
+    offset = 0
+    if state:
+        offset = state["downloaded"]
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = _range_validator(state.get("etag"), state.get("last_modified"))
+
+    response = get_http_session().get(url, stream=True, timeout=timeout, headers=headers)
+    if response.status_code == 416 and state:
+        response.close()
+        clear_resume_state(dest_path, remove_partial=True)
+        return _download_stream(url, dest_path, None, progress_callback, is_running, resume, timeout, buffer_size)
+    response.raise_for_status()
+
+    with response:
+        content_length = int(response.headers.get('content-length', 0))
+        if response.status_code == 206:
+            total_size = offset + content_length if content_length > 0 else 0
+        else:
+            offset = 0
+            total_size = content_length
+
+        state = {
+            "url": url,
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "total": total_size,
+            "downloaded": offset
+        }
+        if resume:
+            save_resume_state(dest_path, state)
+
+        hasher = hashlib.sha256()
+        if offset:
+            hash_file_range(hasher, dest_path, 0, offset)
+
+        writer = DownloadWriter(dest_path, offset, total_size, truncate=offset == 0, hasher=hasher, buffer_size=buffer_size)
+        received_size = offset
+        last_saved = offset
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if is_running is not None and not is_running():
+                    raise InterruptedError()
+                writer.write(chunk)
+                received_size += len(chunk)
+                if resume and offset + writer.written - last_saved >= RESUME_STATE_INTERVAL:
+                    state["downloaded"] = last_saved = offset + writer.written
+                    save_resume_state(dest_path, state)
+                if progress_callback:
+                    progress_callback(received_size, total_size)
+        finally:
+            writer.close()
+            state["downloaded"] = offset + writer.written
+            if resume:
+                save_resume_state(dest_path, state)
+
+    if os.path.getsize(dest_path) > state["downloaded"]:
+        with open(dest_path, 'r+b') as f:
+            f.truncate(state["downloaded"])
+    state["sha256"] = hasher.hexdigest()
+    return state
+
+def _download_segments(url, dest_path, state, progress_callback, is_running, resume, timeout, buffer_size):
+    total_size = state["total"]
+    segments = state["segments"]
+    if not (os.path.exists(dest_path) and os.path.getsize(dest_path) == total_size):
+        with open(dest_path, 'wb') as f:
+            preallocate_file(f, total_size)
+
+    validator = _range_validator(state.get("etag"), state.get("last_modified"))
+    lock = threading.Lock()
+    failed = threading.Event()
+    counters = {"downloaded": sum(segment[2] for segment in segments), "last_saved": 0, "hashed": 0}
+    hasher = hashlib.sha256()
+
+    def record(segment, written):
+        with lock:
+            segment[2] += written
+            state["downloaded"] = sum(seg[2] for seg in segments)
+            if resume and state["downloaded"] - counters["last_saved"] >= RESUME_STATE_INTERVAL:
+                counters["last_saved"] = state["downloaded"]
+                save_resume_state(dest_path, state)
+
+    def fetch_segment(segment):
+        start, end, done = segment
+        if start + done > end:
+            return
+        headers = {'Range': f"bytes={start + done}-{end}"}
+        if validator:
+            headers['If-Range'] = validator
+        with get_http_session().get(url, stream=True, timeout=timeout, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError("Server ignored the byte range request.")
+            position = start + done
+            remaining = end - position + 1
+            recorded = 0
+            writer = DownloadWriter(dest_path, position, buffer_size=buffer_size, buffer_count=SEGMENT_BUFFER_COUNT)
+            try:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if failed.is_set() or (is_running is not None and not is_running()):
+                        raise InterruptedError()
+                    chunk = chunk[:remaining]
+                    writer.write(chunk)
+                    remaining -= len(chunk)
+                    with lock:
+                        if counters["hashed"] == position:
+                            hasher.update(chunk)
+                            counters["hashed"] += len(chunk)
+                        counters["downloaded"] += len(chunk)
+                        if progress_callback:
+                            progress_callback(counters["downloaded"], total_size)
+                    position += len(chunk)
+                    if writer.written - recorded >= RESUME_STATE_INTERVAL:
+                        written = writer.written
+                        record(segment, written - recorded)
+                        recorded = written
+                    if remaining <= 0:
+                        break
+            finally:
+                writer.close()
+                record(segment, writer.written - recorded)
+            if remaining > 0:
+                raise IOError("Connection closed before the byte range was complete.")
+
+    if resume:
+        save_resume_state(dest_path, state)
+    try:
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [executor.submit(fetch_segment, segment) for segment in segments]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                failed.set()
+                raise
+    finally:
+        if resume:
+            save_resume_state(dest_path, state)
+
+    hash_file_range(hasher, dest_path, counters["hashed"], total_size)
+    state["sha256"] = hasher.hexdigest()
+    return state
+
+def download_file(url, dest_path, progress_callback=None, is_running=None, resume=False, timeout=HTTP_TIMEOUT, connections=1,
+                  expected_sha256=None, buffer_size=DOWNLOAD_BUFFER_SIZE):
+    state = load_resume_state(dest_path, url) if resume else None
+
+    if connections > 1 and not (state and "segments" not in state):
+        probe = probe_range_support(url, timeout)
+        if probe and probe[0] >= SEGMENTED_MIN_SIZE:
+            total_size, etag, last_modified = probe
+            if not (state and state.get("total") == total_size and state.get("etag") == etag
+                    and state.get("last_modified") == last_modified):
+                state = {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "total": total_size,
+                    "downloaded": 0,
+                    "segments": split_segments(total_size, connections)
+                }
+            state = _download_segments(url, dest_path, state, progress_callback, is_running, resume, timeout, buffer_size)
+            return verify_download(url, dest_path, state, expected_sha256)
+
+    if state and "segments" in state:
+        state = None
+    state = _download_stream(url, dest_path, state, progress_callback, is_running, resume, timeout, buffer_size)
+    return verify_download(url, dest_path, state, expected_sha256)
+
+def verify_download(url, dest_path, state, expected_sha256):
+    if expected_sha256 and state["sha256"] != expected_sha256.lower():
+        clear_resume_state(dest_path, remove_partial=True)
+        raise ChecksumMismatchError(f"Checksum mismatch for {url}: expected {expected_sha256}, got {state['sha256']}")
+    clear_resume_state(dest_path)
+    return state
+
+class ArchiveCache:
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _save_index(self, index):
+        try:
+            with open(self.index_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=4)
+            os.replace(self.index_path + ".tmp", self.index_path)
+        except OSError as e:
+            print(f"Error saving archive cache index: {e}")
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.zip")
+
+    def _remove_unreferenced(self, index, digest):
+        if any(entry["sha256"] == digest for entry in index.values()):
+            return
+        blob_path = self._blob_path(digest)
+        if os.path.exists(blob_path):
+            os.remove(blob_path)
+
+    def lookup(self, url):
+        with self.lock:
+            entry = self._load_index().get(url)
+        if entry and os.path.exists(self._blob_path(entry["sha256"])):
+            return entry
+        return None
+
+    def discard(self, url):
+        with self.lock:
+            index = self._load_index()
+            entry = index.pop(url, None)
+            if entry:
+                self._remove_unreferenced(index, entry["sha256"])
+                self._save_index(index)
+
+    def _touch(self, url):
+        with self.lock:
+            index = self._load_index()
+            if url in index:
+                index[url]["last_used"] = time.time()
+                self._save_index(index)
+
+    def _evict(self, index, keep_digest):
+        blobs = {}
+        for entry in index.values():
+            last_used, size = blobs.get(entry["sha256"], (0, entry["size"]))
+            blobs[entry["sha256"]] = (max(last_used, entry["last_used"]), size)
+
+        total_size = sum(size for _, size in blobs.values())
+        for digest, (_, size) in sorted(blobs.items(), key=lambda item: item[1][0]):
+            if total_size <= self.max_size:
+                break
+            if digest == keep_digest:
+                continue
+            for url in [url for url, entry in index.items() if entry["sha256"] == digest]:
+                del index[url]
+            self._remove_unreferenced(index, digest)
+            total_size -= size
+
+    def revalidate(self, url, entry, timeout=HTTP_TIMEOUT):
+        headers = {}
+        if entry.get("etag"):
+            headers['If-None-Match'] = entry["etag"]
+        if entry.get("last_modified"):
+            headers['If-Modified-Since'] = entry["last_modified"]
+        if not headers:
+            return False
+        try:
+            response = get_http_session().get(url, stream=True, timeout=timeout, headers=headers)
+            response.close()
+            return response.status_code == 304
+        except requests.RequestException:
+            return True
+
+    def fetch(self, url, progress_callback=None, is_running=None, timeout=HTTP_TIMEOUT, connections=1, buffer_size=DOWNLOAD_BUFFER_SIZE):
+        entry = self.lookup(url)
+        if entry and self.revalidate(url, entry, timeout):
+            self._touch(url)
+            if progress_callback:
+                progress_callback(entry["size"], entry["size"])
+            return self._blob_path(entry["sha256"])
+
+        partial_path = os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + ".part")
+        expected_sha256 = fetch_published_checksum(url, timeout)
+        state = download_file(url, partial_path, progress_callback, is_running, resume=True, timeout=timeout,
+                              connections=connections, expected_sha256=expected_sha256, buffer_size=buffer_size)
+        digest = state["sha256"]
+        blob_path = self._blob_path(digest)
+        os.replace(partial_path, blob_path)
+
+        with self.lock:
+            index = self._load_index()
+            previous = index.get(url)
+            index[url] = {
+                "sha256": digest,
+                "etag": state.get("etag"),
+                "last_modified": state.get("last_modified"),
+                "size": os.path.getsize(blob_path),
+                "last_used": time.time()
+            }
+            if previous and previous["sha256"] != digest:
+                self._remove_unreferenced(index, previous["sha256"])
+            self._evict(index, digest)
+            self._save_index(index)
+        return blob_path
+
+archive_cache = ArchiveCache(ARCHIVE_CACHE_DIR, ARCHIVE_CACHE_MAX_SIZE)
@@ -0,0 +1,179 @@
+import os
+import re
+import html
+import json
+import time
+import hashlib
+import threading
+import urllib.parse
+import xml.etree.ElementTree as ET
+
+from .config import NEWS_CACHE_DIR, NEWS_CACHE_TTL, NEWS_MAX_POSTS, NEWS_SUMMARY_LENGTH, HTTP_TIMEOUT
+from .net import get_http_session
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+FEED_TYPES = ("application/atom+xml", "application/rss+xml")
+
+LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r'([\w-]+)\s*=\s*["\']([^"\']*)["\']')
+IMAGE_PATTERN = re.compile(r'<img\b[^>]*\bsrc\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def feed_url(blog_link):
+    parsed = urllib.parse.urlsplit(blog_link)
+    if parsed.hostname and parsed.hostname.endswith(".blogspot.com") and not parsed.path.startswith("/feeds/"):
+        return urllib.parse.urlunsplit((parsed.scheme or "https", parsed.netloc, "/feeds/posts/default", f"max-results={NEWS_MAX_POSTS}", ""))
+    return blog_link
+
+def discover_feed_url(page_url, page):
+    for tag in LINK_TAG_PATTERN.findall(page):
+        attributes = {name.lower(): value for name, value in ATTRIBUTE_PATTERN.findall(tag)}
+        if attributes.get("rel", "").lower() == "alternate" and attributes.get("type", "").lower() in FEED_TYPES and attributes.get("href"):
+            return urllib.parse.urljoin(page_url, html.unescape(attributes["href"]))
+    return None
+
+def summarize(markup, limit=NEWS_SUMMARY_LENGTH):
+    text = " ".join(html.unescape(TAG_PATTERN.sub(" ", markup or "")).split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + "…"
+
+def make_post(title, link, published, body, thumbnail, base_url):
+    if not thumbnail:
+        match = IMAGE_PATTERN.search(body or "")
+        thumbnail = html.unescape(match.group(1)) if match else None
+    return {
+        "title": " ".join((title or "").split()),
+        "link": urllib.parse.urljoin(base_url, link) if link else base_url,
+        "published": (published or "")[:10],
+        "summary": summarize(body),
+        "thumbnail": urllib.parse.urljoin(base_url, thumbnail) if thumbnail else None
+    }
+
+def media_thumbnail(element):
+    thumbnail = element.find(f"{MEDIA_NS}thumbnail")
+    return thumbnail.get("url") if thumbnail is not None else None
+
+def parse_feed(content, base_url, limit=NEWS_MAX_POSTS):
+    root = ET.fromstring(content)
+    posts = []
+    if root.tag == f"{ATOM_NS}feed":
+        for entry in root.findall(f"{ATOM_NS}entry")[:limit]:
+            link = next((element.get("href") for element in entry.findall(f"{ATOM_NS}link") if element.get("rel", "alternate") == "alternate"), None)
+            body = entry.findtext(f"{ATOM_NS}content") or entry.findtext(f"{ATOM_NS}summary")
+            published = entry.findtext(f"{ATOM_NS}published") or entry.findtext(f"{ATOM_NS}updated")
+            posts.append(make_post(entry.findtext(f"{ATOM_NS}title"), link, published, body, media_thumbnail(entry), base_url))
+        return posts
+
+    channel = root.find("channel")
+    if channel is None:
+        raise ValueError("Unsupported feed format")
+    for item in channel.findall("item")[:limit]:
+        body = item.findtext(f"{CONTENT_NS}encoded") or item.findtext("description")
+        thumbnail = media_thumbnail(item)
+        enclosure = item.find("enclosure")
+        if thumbnail is None and enclosure is not None and enclosure.get("type", "").startswith("image/"):
+            thumbnail = enclosure.get("url")
+        posts.append(make_post(item.findtext("title"), item.findtext("link"), item.findtext("pubDate"), body, thumbnail, base_url))
+    return posts
+
+class NewsFeed:
+    def __init__(self, cache_dir, ttl=NEWS_CACHE_TTL, timeout=HTTP_TIMEOUT):
+        self.cache_dir = cache_dir
+        self.thumbnail_dir = os.path.join(cache_dir, "thumbnails")
+        self.feed_path = os.path.join(cache_dir, "feed.json")
+        self.ttl = ttl
+        self.timeout = timeout
+        self.lock = threading.Lock()
+
+    def load_cached(self, blog_link):
+        try:
+            with open(self.feed_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+        return entry if entry.get("blog_link") == blog_link else None
+
+    def _save(self, entry):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.feed_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(entry, f, indent=4)
+            os.replace(self.feed_path + ".tmp", self.feed_path)
+        except OSError as e:
+            print(f"Error saving news cache: {e}")
+
+    def is_stale(self, entry):
+        return entry is None or time.time() - entry.get("fetched", 0) > self.ttl
+
+    def refresh(self, blog_link):
+        cached = self.load_cached(blog_link)
+        url = cached["feed_url"] if cached else feed_url(blog_link)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        session = get_http_session()
+        response = session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            cached["fetched"] = time.time()
+            with self.lock:
+                self._save(cached)
+            return cached["posts"]
+        response.raise_for_status()
+
+        if "html" in response.headers.get("Content-Type", ""):
+            url = discover_feed_url(response.url, response.text)
+            if url is None:
+                raise ValueError(f"No news feed found at {blog_link}")
+            response = session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+
+        posts = parse_feed(response.content, response.url)
+        with self.lock:
+            self._save({
+                "blog_link": blog_link,
+                "feed_url": url,
+                "fetched": time.time(),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "posts": posts
+            })
+            self.prune_thumbnails(posts)
+        return posts
+
+    def thumbnail_path(self, url):
+        return os.path.join(self.thumbnail_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def cached_thumbnail(self, url):
+        path = self.thumbnail_path(url)
+        return path if os.path.exists(path) else None
+
+    def fetch_thumbnail(self, url):
+        path = self.thumbnail_path(url)
+        if os.path.exists(path):
+            return path
+        response = get_http_session().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+        with open(path + ".tmp", 'wb') as f:
+            f.write(response.content)
+        os.replace(path + ".tmp", path)
+        return path
+
+    def prune_thumbnails(self, posts):
+        if not os.path.isdir(self.thumbnail_dir):
+            return
+        keep = {os.path.basename(self.thumbnail_path(post["thumbnail"])) for post in posts if post["thumbnail"]}
+        for name in os.listdir(self.thumbnail_dir):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.thumbnail_dir, name))
+                except OSError:
+                    pass
+
+news_feed = NewsFeed(NEWS_CACHE_DIR)
@@ -0,0 +1,76 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+class StartupProfiler:
+    def __init__(self, argv):
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.open_phases = {}
+        self.events = []
+        self.reported = False
+        self.enabled = False
+        self.trace_path = None
+        for arg in argv:
+            if arg == "--profile-startup" or arg.startswith("--profile-startup="):
+                self.enabled = True
+                self.trace_path = arg.partition("=")[2] or None
+
+    def begin(self, name):
+        with self.lock:
+            self.open_phases[name] = time.perf_counter()
+
+    def end(self, name):
+        end = time.perf_counter()
+        with self.lock:
+            start = self.open_phases.pop(name, None)
+        if start is not None:
+            self.record(name, start, end)
+
+    def record(self, name, start, end):
+        thread = threading.current_thread()
+        with self.lock:
+            self.events.append((name, start - self.origin, end - start, thread.ident, thread.name))
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def report(self):
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        with self.lock:
+            events = sorted(self.events, key=lambda event: event[1])
+        print("Startup profile (ms):")
+        print(f"{'start':>10} {'duration':>10}  {'thread':<20} phase")
+        for name, start, duration, _, thread_name in events:
+            print(f"{start * 1000:10.1f} {duration * 1000:10.1f}  {thread_name[:20]:<20} {name}")
+        print(f"{'':>10} {(time.perf_counter() - self.origin) * 1000:10.1f}  {'':<20} total")
+        if self.trace_path:
+            self.write_trace(self.trace_path, events)
+
+    def write_trace(self, path, events):
+        trace = {"traceEvents": [], "displayTimeUnit": "ms"}
+        for name, start, duration, thread_id, thread_name in events:
+            trace["traceEvents"].append({
+                "name": name, "cat": "startup", "ph": "X", "pid": os.getpid(), "tid": thread_id,
+                "ts": round(start * 1e6), "dur": round(duration * 1e6)
+            })
+        for thread_id, thread_name in {(event[3], event[4]) for event in events}:
+            trace["traceEvents"].append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread_id, "args": {"name": thread_name}})
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f)
+            print(f"Startup trace written to {path}")
+        except OSError as e:
+            print(f"Error writing startup trace: {e}")
+
+startup_profiler = StartupProfiler(sys.argv)
@@ -0,0 +1,1684 @@
+import os
+import subprocess
+import webbrowser
+import shutil
+import time
+import threading
+import sys
+import re
+import json
+import base64
+import html
+import queue
+import functools
+from collections import OrderedDict
+
+from .profiling import startup_profiler
+
+startup_profiler.begin("import_qt")
+
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QPushButton, QFileDialog, QVBoxLayout,
+    QWidget, QLabel, QMessageBox, QComboBox, QDialog, QHBoxLayout,
+    QSplashScreen, QProgressDialog, QLineEdit, QCheckBox, QSystemTrayIcon,
+    QMenu, QStyle, QTextBrowser
+)
+from PyQt6.QtGui import QFont, QPalette, QLinearGradient, QColor, QBrush, QIcon, QPainter, QFontDatabase, QAction, QImage, QImageReader, QPixmap, QTextDocument
+from PyQt6.QtCore import Qt, QUrl, QRect, QSize, QObject, pyqtSignal, QThread, QCoreApplication, QByteArray, QTimer, QFileSystemWatcher
+
+startup_profiler.end("import_qt")
+
+from . import __version__
+from .config import (
+    IS_WINDOWS, IS_MACOS, CLIENT_ID, USER_AGENT, YANIX_PATH, DATA_DOWNLOAD_URL, BACKGROUNDS_DOWNLOAD_URL,
+    PADMODE_DOWNLOAD_URL, LATEST_VERSION_URL, HTTP_TIMEOUT, PROGRESS_REFRESH_MS, SPLASH_FRAME_INTERVAL_MS, THEME_CACHE_SIZE, DOWNLOAD_CONNECTIONS,
+    WINDOW_SIZE, BACKGROUND_SCALE_RATIOS, BACKGROUND_DERIVATIVE_FORMAT, BACKGROUND_DERIVATIVE_QUALITY,
+    DOWNLOAD_BUFFER_SIZE, STARTUP_WORKERS, ICON_PATH, CUSTOM_THEMES_DIR, BACKGROUNDS_DIR, PADMODE_SCRIPT_PATH,
+    NEWS_THUMBNAIL_SIZE, BLOG_PROFILE_DIR, BLOG_HTTP_CACHE_SIZE, JOST_FONT_PATH, YAN_SIM_DOWNLOAD_URL, YAN_SIM_INSTALL_PATH, LANGUAGES, THEMES,
+    load_config, save_config, handle_first_run
+)
+from .net import connectivity, check_internet_connection, get_http_session, archive_cache
+from .news import news_feed
+from .install import (
+    StreamingZipError, stream_install, extract_archive, run_task_graph, format_duration, ProgressTracker, asset_store,
+    parse_package_version, stage_package_version, activate_package_version
+)
+from .launch import (
+    probe_wine_version, probe_software_rendering, load_presence, resolve_game_executable,
+    build_game_command, build_game_env, trim_process_memory
+)
+
+def parse_custom_theme(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        theme_data = json.load(f)
+    
+    required_keys = ["button_bg_color", "button_text_color",
+                     "button_hover_bg_color", "label_text_color", "border_color"]
+    
+    if not all(key in theme_data for key in required_keys):
+        raise ValueError("Invalid .yltheme file: missing required keys.")
+    
+    return theme_data
+
+def load_custom_theme(filepath, lang_data):
+    try:
+        return parse_custom_theme(filepath)
+    except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+        QMessageBox.critical(None, lang_data["theme_error_title"], lang_data["theme_load_error"].format(filepath=filepath, e=e))
+        return None
+
+class ThemeRegistry(QObject):
+    theme_changed = pyqtSignal(str)
+    themes_changed = pyqtSignal()
+    theme_error = pyqtSignal(str, str)
+
+    def __init__(self, themes_dir, parent=None):
+        super().__init__(parent)
+        self.themes_dir = themes_dir
+        self.entries = {}
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        if os.path.isdir(themes_dir):
+            self.watcher.addPath(themes_dir)
+        self.index = self._scan()
+
+    def _scan(self):
+        try:
+            return sorted(os.path.join(self.themes_dir, f) for f in os.listdir(self.themes_dir) if f.endswith(".yltheme"))
+        except OSError:
+            return []
+
+    def paths(self):
+        return list(self.index)
+
+    def get(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(path)
+        if entry and entry[0] == signature:
+            return entry[1]
+
+        try:
+            theme_data, error = parse_custom_theme(path), None
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            theme_data, error = None, str(e)
+        self.entries[path] = (signature, theme_data)
+        if path not in self.watcher.files():
+            self.watcher.addPath(path)
+        if error:
+            self.theme_error.emit(path, error)
+        return theme_data
+
+    def _on_directory_changed(self, path):
+        index = self._scan()
+        if index != self.index:
+            self.index = index
+            self.themes_changed.emit()
+
+    def _on_file_changed(self, path):
+        self.entries.pop(path, None)
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+        self.theme_changed.emit(path)
+
+BACKGROUND_DERIVATIVE_PATTERN = re.compile(rf"\.\d+x\d+\.{BACKGROUND_DERIVATIVE_FORMAT}$")
+
+def background_derivative_path(path, target_size):
+    root = os.path.splitext(path)[0]
+    return f"{root}.{target_size.width()}x{target_size.height()}.{BACKGROUND_DERIVATIVE_FORMAT}"
+
+def background_target_size(size, ratio):
+    return QSize(round(size.width() * ratio), round(size.height() * ratio))
+
+def scale_background(reader, target_size):
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if not source_size.isValid():
+        image = image.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+    return image.copy(0, 0, target_size.width(), target_size.height())
+
+def is_derivative_fresh(derivative_path, source_path):
+    try:
+        return os.stat(derivative_path).st_mtime_ns >= os.stat(source_path).st_mtime_ns
+    except OSError:
+        return False
+
+def load_background_image(path, target_size):
+    derivative_path = background_derivative_path(path, target_size)
+    if is_derivative_fresh(derivative_path, path):
+        image = QImage(derivative_path)
+        if not image.isNull():
+            return image
+    return scale_background(QImageReader(path), target_size)
+
+def generate_background_derivatives(folder, size=QSize(*WINDOW_SIZE), ratios=BACKGROUND_SCALE_RATIOS):
+    generated = 0
+    names = os.listdir(folder)
+    sources = {os.path.splitext(name)[0] for name in names if not BACKGROUND_DERIVATIVE_PATTERN.search(name)}
+    for name in names:
+        path = os.path.join(folder, name)
+        match = BACKGROUND_DERIVATIVE_PATTERN.search(name)
+        if match:
+            if name[:match.start()] not in sources:
+                os.remove(path)
+            continue
+        if name.endswith(".tmp"):
+            os.remove(path)
+            continue
+        if not QImageReader.imageFormat(path):
+            continue
+        for ratio in ratios:
+            target_size = background_target_size(size, ratio)
+            derivative_path = background_derivative_path(path, target_size)
+            if is_derivative_fresh(derivative_path, path):
+                continue
+            image = scale_background(QImageReader(path), target_size)
+            if image.isNull():
+                break
+            if image.save(derivative_path + ".tmp", BACKGROUND_DERIVATIVE_FORMAT, BACKGROUND_DERIVATIVE_QUALITY):
+                os.replace(derivative_path + ".tmp", derivative_path)
+                generated += 1
+    return generated
+
+class CompiledTheme:
+    def __init__(self, theme):
+        self.theme = theme
+        self.button_style = f"""
+            QPushButton {{
+                color: {theme["button_text_color"]};
+                background-color: {theme["button_bg_color"]};
+                padding: 10px;
+                border-radius: 6px;
+                border: 1px solid {theme["border_color"]};
+                font-family: Jost;
+            }}
+            QPushButton:hover {{
+                background-color: {theme["button_hover_bg_color"]};
+            }}
+        """
+        self.label_style = f"color: {theme['label_text_color']}; margin-top: 20px; font-family: Jost;"
+        self.blog_view_style = f"""
+            QWebEngineView, QTextBrowser {{
+                border: 2px solid {theme["border_color"]};
+                border-radius: 8px;
+            }}
+            QTextBrowser {{
+                color: {theme["button_text_color"]};
+                background-color: {theme["button_bg_color"]};
+                padding: 6px;
+            }}
+        """
+        background_image = theme.get("background_image")
+        self.image_path = background_image if background_image and os.path.exists(background_image) else None
+        self.image = None if self.image_path else self.load_embedded_image()
+
+    def load_embedded_image(self):
+        if "background_base64" not in self.theme:
+            return None
+        try:
+            image = QImage.fromData(base64.b64decode(self.theme["background_base64"]))
+        except ValueError:
+            return None
+        return None if image.isNull() else image
+
+    def has_background(self):
+        return self.image_path is not None or self.image is not None
+
+    def load_background(self, target_size):
+        if self.image_path:
+            return load_background_image(self.image_path, target_size)
+        return self.image.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+
+    def gradient_brush(self, height):
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(self.theme.get("background_color_start", "#000000")))
+        gradient.setColorAt(1, QColor(self.theme.get("background_color_end", "#000000")))
+        return QBrush(gradient)
+
+class ThemeEngine:
+    def __init__(self, max_entries=THEME_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.compiled = OrderedDict()
+        self.pixmaps = OrderedDict()
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+        return value
+
+    def compile(self, key, load_theme):
+        compiled = self.compiled.get(key)
+        if compiled is None:
+            return self._remember(self.compiled, key, CompiledTheme(load_theme()))
+        self.compiled.move_to_end(key)
+        return compiled
+
+    def background_brush(self, key, compiled, size, ratio):
+        if not compiled.has_background():
+            return compiled.gradient_brush(size.height())
+        cache_key = (key, size.width(), size.height(), ratio)
+        pixmap = self.pixmaps.get(cache_key)
+        if pixmap is None:
+            image = compiled.load_background(background_target_size(size, ratio))
+            if image.isNull():
+                return compiled.gradient_brush(size.height())
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(ratio)
+            self._remember(self.pixmaps, cache_key, pixmap)
+        else:
+            self.pixmaps.move_to_end(cache_key)
+        return QBrush(pixmap)
+
+    def clear(self):
+        self.compiled.clear()
+        self.pixmaps.clear()
+
+class DownloadSignals(QObject):
+    data_ready = pyqtSignal()
+    download_complete = pyqtSignal()
+    download_failed = pyqtSignal(str)
+    extraction_complete = pyqtSignal()
+    extraction_failed = pyqtSignal(str)
+    ask_install = pyqtSignal()
+
+class UpdateCheckerSignals(QObject):
+    update_status = pyqtSignal(str)
+    update_found = pyqtSignal(str)
+
+class EnvironmentSignals(QObject):
+    wine_outdated = pyqtSignal(str)
+    software_rendering = pyqtSignal()
+
+class YanixSplashScreen(QSplashScreen):
+    def __init__(self, current_lang_data):
+        super().__init__()
+        self.current_lang = current_lang_data
+        self.setFixedSize(600, 300)
+        self.setWindowFlags(Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint)
+        self.message = ""
+        self.progress_text = ""
+        self.font_title = QFont("Jost", 32, QFont.Weight.Bold)
+        self.font_message = QFont("Jost", 16)
+        self.font_progress = QFont("Jost", 12)
+        self.background = None
+        self.last_paint = 0.0
+        self.paint_timer = QTimer(self)
+        self.paint_timer.setSingleShot(True)
+        self.paint_timer.timeout.connect(self.update)
+        self.update_splash_content(self.current_lang["downloading_data"])
+
+    def render_background(self):
+        rect = self.rect()
+        ratio = self.devicePixelRatioF()
+        background = QPixmap(int(rect.width() * ratio), int(rect.height() * ratio))
+        background.setDevicePixelRatio(ratio)
+
+        painter = QPainter(background)
+        gradient = QLinearGradient(0, 0, 0, rect.height())
+        gradient.setColorAt(0, QColor(THEMES["yanix-legacy"]["background_color_start"]))
+        gradient.setColorAt(1, QColor(THEMES["yanix-legacy"]["background_color_end"]))
+        painter.fillRect(rect, gradient)
+
+        painter.setPen(QColor(0, 0, 0))
+        painter.drawRect(rect.adjusted(20, 20, -20, -20))
+
+        text_rect = QRect(rect.width() // 2 - 200, rect.height() // 2 - 50, 400, 100)
+        painter.setFont(self.font_title)
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, "Yanix Launcher")
+        painter.end()
+        return background
+
+    def paintEvent(self, event):
+        if self.background is None or self.background.devicePixelRatio() != self.devicePixelRatioF():
+            self.background = self.render_background()
+        self.last_paint = time.monotonic()
+
+        painter = QPainter(self)
+        rect = self.rect()
+        painter.drawPixmap(0, 0, self.background)
+
+        painter.setFont(self.font_message)
+        painter.setPen(QColor(0, 0, 0))
+        message_rect = QRect(rect.width() // 2 - 200, rect.height() // 2 + 10, 400, 50)
+        painter.drawText(message_rect, Qt.AlignmentFlag.AlignCenter, self.message)
+
+        painter.setFont(self.font_progress)
+        progress_rect = QRect(rect.width() - 150, rect.height() - 50, 100, 30)
+        painter.drawText(progress_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, self.progress_text)
+
+    def update_splash_content(self, message, progress=""):
+        self.message = message
+        self.progress_text = progress
+        if self.paint_timer.isActive():
+            return
+        delay_ms = SPLASH_FRAME_INTERVAL_MS - (time.monotonic() - self.last_paint) * 1000
+        if delay_ms > 0:
+            self.paint_timer.start(int(delay_ms))
+        else:
+            self.update()
+
+    def refresh_progress(self, tracker):
+        snapshot = tracker.snapshot()
+        if snapshot["phase"] == "startup" and snapshot["total"] > 0:
+            progress = f"{int(snapshot['fraction'] * 100)}%"
+            if snapshot["eta"] is not None:
+                progress += f" ({format_duration(snapshot['eta'])})"
+        else:
+            progress = ""
+        if snapshot["message"] and (snapshot["message"], progress) != (self.message, self.progress_text):
+            self.update_splash_content(snapshot["message"], progress)
+
+class StartupWorker(QObject):
+    def __init__(self, current_lang_data, signals, config, is_first_run):
+        super().__init__()
+        self.current_lang_data = current_lang_data
+        self.signals = signals
+        self.config = config
+        self.is_first_run = is_first_run
+        self.install_event = threading.Event()
+        self.should_install = False
+        self.progress = ProgressTracker()
+        self.data_ready_sent = False
+        self.assets_ready = False
+        self.dependencies_pending = False
+        self.progress_lock = threading.Lock()
+        self.download_progress = {}
+        self.extraction_progress = {}
+
+    def report_download(self, key, message, downloaded_size, total_size):
+        with self.progress_lock:
+            self.download_progress[key] = (downloaded_size, total_size)
+            if sum(1 for downloaded, total in self.download_progress.values() if downloaded < total) > 1:
+                message = self.current_lang_data["downloading_data"]
+        self.report_progress(message)
+
+    def report_extraction(self, key, extracted_bytes, total_bytes):
+        with self.progress_lock:
+            self.extraction_progress[key] = (extracted_bytes, total_bytes)
+        self.report_progress(self.current_lang_data["extracting_data"])
+
+    def report_progress(self, message):
+        with self.progress_lock:
+            done = 0
+            total = 0
+            for key, (downloaded_size, download_total) in self.download_progress.items():
+                extracted_bytes, extract_total = self.extraction_progress.get(key, (0, 0))
+                done += downloaded_size + (download_total * extracted_bytes // extract_total if extract_total else 0)
+                total += 2 * download_total
+        self.progress.update("startup", done, total, message)
+
+    def fetch_asset(self, key, url, msg_download, msg_fail_dl):
+        self.progress.set_message(msg_download)
+        try:
+            return archive_cache.fetch(
+                url,
+                lambda downloaded_size, total_size: self.report_download(key, msg_download, downloaded_size, total_size),
+                connections=DOWNLOAD_CONNECTIONS,
+                buffer_size=self.config.get("download_buffer_size", DOWNLOAD_BUFFER_SIZE)
+            )
+        except Exception as e:
+            with self.progress_lock:
+                self.download_progress.pop(key, None)
+            self.signals.download_failed.emit(f"{msg_fail_dl} ({e}).")
+            return None
+
+    def mark_data_ready(self):
+        with self.progress_lock:
+            self.assets_ready = True
+            if self.data_ready_sent or self.dependencies_pending:
+                return
+            self.data_ready_sent = True
+        self.signals.data_ready.emit()
+
+    def extract_asset(self, key, url, target_folder, msg_fail_ext, required, archive_path):
+        try:
+            if archive_path is None:
+                return
+            self.progress.set_message(self.current_lang_data["extracting_data"])
+            try:
+                extract_archive(archive_path, target_folder, lambda extracted_bytes, total_bytes: self.report_extraction(key, extracted_bytes, total_bytes), flatten=True)
+                asset_store.record_archive(key, url, archive_path)
+            except Exception as e:
+                archive_cache.discard(url)
+                self.signals.extraction_failed.emit(f"{msg_fail_ext} ({e}).")
+        finally:
+            if required:
+                self.mark_data_ready()
+
+    def sync_asset(self, key, url, target_folder):
+        if not connectivity.is_online(url):
+            return
+        try:
+            updated = asset_store.sync(key, url, target_folder)
+            if updated:
+                print(f"Updated {updated} {key} files.")
+        except Exception as e:
+            print(f"Failed to update {key}: {e}")
+
+    def scale_backgrounds(self, *results):
+        try:
+            generate_background_derivatives(BACKGROUNDS_DIR)
+        except Exception as e:
+            print(f"Failed to generate scaled backgrounds: {e}")
+
+    def install_dependencies(self, *results):
+        try:
+            self.signals.ask_install.emit()
+            self.install_event.wait()
+
+            if self.should_install:
+                self.progress.update(None, 0, 0, self.current_lang_data.get("installing_corefonts", "Installing corefonts..."))
+                try:
+                    subprocess.run(["winetricks", "-q", "corefonts"], check=True)
+                except Exception as e:
+                    print(f"Failed to install corefonts: {e}")
+
+                self.progress.update(None, 0, 0, self.current_lang_data.get("installing_dxvk", "Installing dxvk..."))
+                try:
+                    subprocess.run(["winetricks", "-q", "dxvk"], check=True)
+                except Exception as e:
+                    print(f"Failed to install dxvk: {e}")
+        finally:
+            with self.progress_lock:
+                self.dependencies_pending = False
+                assets_ready = self.assets_ready
+            if assets_ready:
+                self.mark_data_ready()
+
+    def run_profiled(self, name, task, *args):
+        with startup_profiler.phase(name):
+            return task(*args)
+
+    def startup_assets(self):
+        return [
+            ("data", DATA_DOWNLOAD_URL, os.path.join(YANIX_PATH, "data"), True,
+             self.current_lang_data["downloading_data"],
+             self.current_lang_data["download_failed"],
+             self.current_lang_data["extract_failed"]),
+            ("backgrounds", BACKGROUNDS_DOWNLOAD_URL, BACKGROUNDS_DIR, False,
+             self.current_lang_data.get("downloading_backgrounds", "Downloading Backgrounds..."),
+             "Failed to download backgrounds.",
+             "Failed to extract backgrounds.")
+        ]
+
+    def run(self):
+        self.dependencies_pending = bool(self.is_first_run and not IS_WINDOWS and shutil.which("winetricks"))
+        assets = self.startup_assets()
+        missing = [asset for asset in assets if not asset_store.is_installed(asset[2])]
+        if not any(required for _, _, _, required, *_ in missing):
+            self.mark_data_ready()
+        for asset in assets:
+            connectivity.refresh(asset[1])
+
+        tasks = {}
+        for key, url, target_folder, required, msg_download, msg_fail_dl, msg_fail_ext in assets:
+            if asset_store.is_installed(target_folder):
+                tasks[f"sync_{key}"] = (functools.partial(self.sync_asset, key, url, target_folder), [])
+                continue
+            if not (check_internet_connection(url) or archive_cache.lookup(url)):
+                if required:
+                    self.mark_data_ready()
+                continue
+            tasks[f"fetch_{key}"] = (functools.partial(self.fetch_asset, key, url, msg_download, msg_fail_dl), [])
+            tasks[f"extract_{key}"] = (functools.partial(self.extract_asset, key, url, target_folder, msg_fail_ext, required), [f"fetch_{key}"])
+
+        background_tasks = [name for name in ("extract_backgrounds", "sync_backgrounds") if name in tasks]
+        if background_tasks:
+            tasks["scale_backgrounds"] = (self.scale_backgrounds, background_tasks)
+
+        if self.dependencies_pending:
+            tasks["install_dependencies"] = (self.install_dependencies, [name for name in tasks if name.startswith("extract_")])
+
+        tasks = {name: (functools.partial(self.run_profiled, name, task), dependencies) for name, (task, dependencies) in tasks.items()}
+        try:
+            run_task_graph(tasks, STARTUP_WORKERS)
+        finally:
+            with self.progress_lock:
+                self.dependencies_pending = False
+            self.mark_data_ready()
+            self.signals.download_complete.emit()
+
+class EnvironmentProber(QObject):
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        with startup_profiler.phase("probe_wine"):
+            wine_version = probe_wine_version()
+        if wine_version and int(wine_version.split('.')[0]) < 8:
+            self.signals.wine_outdated.emit(wine_version)
+        with startup_profiler.phase("probe_glxinfo"):
+            software_rendering = probe_software_rendering()
+        if software_rendering:
+            self.signals.software_rendering.emit()
+
+class UpdateChecker(QObject):
+    def __init__(self, current_version, lang_data, signals):
+        super().__init__()
+        self.current_version = current_version
+        self.lang_data = lang_data
+        self.signals = signals
+
+    def run(self):
+        if not check_internet_connection(LATEST_VERSION_URL):
+            self.signals.update_status.emit(self.lang_data["no_internet"])
+            return
+
+        try:
+            response = get_http_session().get(LATEST_VERSION_URL, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            latest_version_tuple = parse_package_version(response.text)
+
+            if latest_version_tuple is None:
+                self.signals.update_status.emit(self.lang_data["update_error"])
+                return
+
+            current_version_tuple = tuple(map(int, self.current_version.split('.')))
+
+            if latest_version_tuple > current_version_tuple:
+                latest_version = '.'.join(map(str, latest_version_tuple))
+                stage_package_version(latest_version)
+                self.signals.update_found.emit(latest_version)
+            elif latest_version_tuple < current_version_tuple:
+                self.signals.update_status.emit(self.lang_data["update_developer"])
+            else:
+                self.signals.update_status.emit(self.lang_data["update_uptodate"])
+
+        except Exception as e:
+            self.signals.update_status.emit(f"{self.lang_data['update_error']} ({e})")
+
+class NewsPanel(QTextBrowser):
+    loadFinished = pyqtSignal(bool)
+    posts_loaded = pyqtSignal(str, object)
+    load_failed = pyqtSignal(str, str)
+    thumbnail_loaded = pyqtSignal(str, str)
+
+    def __init__(self, lang_data, parent=None):
+        super().__init__(parent)
+        self.lang_data = lang_data
+        self.blog_link = None
+        self.posts = []
+        self.requested_thumbnails = set()
+        self.thumbnail_queue = queue.Queue()
+        self.thumbnail_thread = None
+        self.setOpenExternalLinks(True)
+        self.setFont(QFont("Jost", 11))
+        self.posts_loaded.connect(self._on_posts_loaded)
+        self.load_failed.connect(self._on_load_failed)
+        self.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+
+    def load(self, url):
+        self.blog_link = url.toString()
+        cached = news_feed.load_cached(self.blog_link)
+        if cached:
+            self.show_posts(cached["posts"])
+        else:
+            self.posts = []
+            self.setHtml(f"<p>{html.escape(self.lang_data.get('news_loading', 'Loading news...'))}</p>")
+        if news_feed.is_stale(cached):
+            threading.Thread(target=self._refresh, args=(self.blog_link,), name="news-refresh", daemon=True).start()
+        else:
+            self.loadFinished.emit(True)
+
+    def _refresh(self, blog_link):
+        try:
+            posts = news_feed.refresh(blog_link)
+        except Exception as e:
+            self.load_failed.emit(blog_link, str(e))
+            return
+        self.posts_loaded.emit(blog_link, posts)
+
+    def _on_posts_loaded(self, blog_link, posts):
+        if blog_link != self.blog_link:
+            return
+        self.show_posts(posts)
+        self.loadFinished.emit(True)
+
+    def _on_load_failed(self, blog_link, error):
+        if blog_link != self.blog_link:
+            return
+        print(f"Failed to load news: {error}")
+        if not self.posts:
+            message = html.escape(self.lang_data.get("news_error", "Could not load the news feed."))
+            self.setHtml(f'<p>{message}</p><p><a href="{html.escape(blog_link)}">{html.escape(blog_link)}</a></p>')
+        self.loadFinished.emit(False)
+
+    def show_posts(self, posts):
+        self.posts = posts
+        blocks = []
+        for post in posts:
+            image = ""
+            if post["thumbnail"]:
+                image = f'<td width="{NEWS_THUMBNAIL_SIZE + 8}"><img src="{html.escape(post["thumbnail"])}" width="{NEWS_THUMBNAIL_SIZE}" height="{NEWS_THUMBNAIL_SIZE}"></td>'
+            blocks.append(
+                f'<table cellspacing="0"><tr>{image}<td><a href="{html.escape(post["link"])}"><b>{html.escape(post["title"])}</b></a><br>'
+                f'<small>{html.escape(post["published"])}</small><br>{html.escape(post["summary"])}</td></tr></table>'
+            )
+        scroll = self.verticalScrollBar().value()
+        self.setHtml("<hr>".join(blocks) or f"<p>{html.escape(self.lang_data.get('news_empty', 'No news yet.'))}</p>")
+        self.verticalScrollBar().setValue(scroll)
+
+    def loadResource(self, resource_type, url):
+        if resource_type == QTextDocument.ResourceType.ImageResource.value and url.scheme() in ("http", "https"):
+            path = news_feed.cached_thumbnail(url.toString())
+            if path:
+                return QImage(path)
+            self.request_thumbnail(url.toString())
+            return None
+        return super().loadResource(resource_type, url)
+
+    def request_thumbnail(self, url):
+        if url in self.requested_thumbnails:
+            return
+        self.requested_thumbnails.add(url)
+        self.thumbnail_queue.put(url)
+        if self.thumbnail_thread is None:
+            self.thumbnail_thread = threading.Thread(target=self._fetch_thumbnails, name="news-thumbnails", daemon=True)
+            self.thumbnail_thread.start()
+
+    def _fetch_thumbnails(self):
+        while True:
+            url = self.thumbnail_queue.get()
+            try:
+                path = news_feed.fetch_thumbnail(url)
+            except Exception as e:
+                print(f"Failed to load news thumbnail {url}: {e}")
+                continue
+            try:
+                self.thumbnail_loaded.emit(url, path)
+            except RuntimeError:
+                return
+
+    def _on_thumbnail_loaded(self, url, path):
+        image = QImage(path)
+        if image.isNull():
+            return
+        self.document().addResource(QTextDocument.ResourceType.ImageResource.value, QUrl(url), image)
+        self.viewport().update()
+
+class SettingsDialog(QDialog):
+    def __init__(self, config, lang_data, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.lang_data = lang_data
+        self.setWindowTitle(lang_data["settings"])
+        self.setFixedSize(400, 250)
+        
+        layout = QVBoxLayout()
+
+        lang_label = QLabel(lang_data["select_language"])
+        lang_label.setFont(QFont("Jost", 12))
+        layout.addWidget(lang_label)
+        self.lang_selector = QComboBox()
+        self.lang_selector.addItems(list(LANGUAGES))
+        self.lang_selector.setCurrentText(self.config["language"])
+        self.lang_selector.setFont(QFont("Jost", 10))
+        layout.addWidget(self.lang_selector)
+
+        theme_label = QLabel(lang_data["select_theme"])
+        theme_label.setFont(QFont("Jost", 12))
+        layout.addWidget(theme_label)
+        self.theme_selector = QComboBox()
+        self.update_theme_selector_items()
+        self.theme_selector.setCurrentText(self.config["theme"])
+        self.theme_selector.setFont(QFont("Jost", 10))
+        layout.addWidget(self.theme_selector)
+
+        self.load_custom_theme_button = QPushButton(lang_data["load_custom_theme"])
+        self.load_custom_theme_button.clicked.connect(self.load_custom_theme_file)
+        self.load_custom_theme_button.setFont(QFont("Jost", 10))
+        layout.addWidget(self.load_custom_theme_button)
+
+        if self.config["advanced_mode"]:
+            self.setup_advanced_settings(layout, lang_data)
+            self.setFixedSize(400, 840)
+
+        self.apply_btn = QPushButton(lang_data["apply"])
+        self.apply_btn.clicked.connect(self.apply_settings)
+        self.apply_btn.setFont(QFont("Jost", 10))
+        layout.addWidget(self.apply_btn)
+
+        self.setLayout(layout)
+        self.apply_theme_to_settings_buttons()
+
+    def setup_advanced_settings(self, layout, lang_data):
+        adv_label = QLabel("Advanced Settings")
+        adv_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        adv_label.setFont(QFont("Jost", 14, QFont.Weight.Bold))
+        layout.addWidget(adv_label)
+
+        blog_link_label = QLabel("Blog Link URL")
+        blog_link_label.setFont(QFont("Jost", 12))
+        layout.addWidget(blog_link_label)
+        self.blog_link_edit = QLineEdit()
+        self.blog_link_edit.setText(self.config.get("blog_link", ""))
+        self.blog_link_edit.setFont(QFont("Jost", 10))
+        layout.addWidget(self.blog_link_edit)
+
+        self.lite_news_checkbox = QCheckBox(lang_data.get("lite_news", "Lite News Panel (no embedded browser)"))
+        self.lite_news_checkbox.setChecked(self.config.get("lite_news", False))
+        self.lite_news_checkbox.setFont(QFont("Jost", 10))
+        layout.addWidget(self.lite_news_checkbox)
+
+        self.low_footprint_tray_checkbox = QCheckBox(lang_data.get("low_footprint_tray", "Free Launcher Memory While Playing"))
+        self.low_footprint_tray_checkbox.setChecked(self.config.get("low_footprint_tray", True))
+        self.low_footprint_tray_checkbox.setFont(QFont("Jost", 10))
+        layout.addWidget(self.low_footprint_tray_checkbox)
+
+        self.discord_rpc_checkbox = QCheckBox("Enable Discord Rich Presence")
+        self.discord_rpc_checkbox.setChecked(self.config.get("discord_rpc", True))
+        self.discord_rpc_checkbox.setFont(QFont("Jost", 10))
+        layout.addWidget(self.discord_rpc_checkbox)
+        
+        if not IS_WINDOWS:
+            self.gamemode_checkbox = QCheckBox(lang_data.get("gamemode", "Enable GameMode (Linux)"))
+            self.gamemode_checkbox.setChecked(self.config.get("gamemode", False))
+            self.gamemode_checkbox.setFont(QFont("Jost", 10))
+            layout.addWidget(self.gamemode_checkbox)
+
+            self.fsr_checkbox = QCheckBox(lang_data.get("fsr", "Enable FSR (Linux)"))
+            self.fsr_checkbox.setChecked(self.config.get("fsr", False))
+            self.fsr_checkbox.setFont(QFont("Jost", 10))
+            layout.addWidget(self.fsr_checkbox)
+
+        self.stream_install_checkbox = QCheckBox(lang_data.get("stream_install", "Extract While Downloading"))
+        self.stream_install_checkbox.setChecked(self.config.get("stream_install", False))
+        self.stream_install_checkbox.setFont(QFont("Jost", 10))
+        layout.addWidget(self.stream_install_checkbox)
+
+        self.launch_command_label = QLabel(lang_data.get("launch_command_label", "Custom Launch Command (%LC% = Game Command)"))
+        self.launch_command_label.setFont(QFont("Jost", 12))
+        layout.addWidget(self.launch_command_label)
+        self.launch_command_edit = QLineEdit()
+        self.launch_command_edit.setText(self.config.get("launch_command", ""))
+        self.launch_command_edit.setFont(QFont("Jost", 10))
+        layout.addWidget(self.launch_command_edit)
+
+        self.select_exe_button = QPushButton(self.parent().lang["select_exe"])
+        self.select_exe_button.clicked.connect(self.parent().select_exe)
+        self.select_exe_button.setFont(QFont("Jost", 10))
+        layout.addWidget(self.select_exe_button)
+        
+        self.open_folder_button = QPushButton(lang_data.get("open_folder", "Open Game Folder"))
+        self.open_folder_button.clicked.connect(self.open_game_folder)
+        self.open_folder_button.setFont(QFont("Jost", 10))
+        layout.addWidget(self.open_folder_button)
+
+        if not IS_WINDOWS:
+            self.wineprefix_button = QPushButton(self.parent().lang["wineprefix"])
+            self.wineprefix_button.clicked.connect(self.parent().select_wineprefix)
+            self.wineprefix_button.setFont(QFont("Jost", 10))
+            layout.addWidget(self.wineprefix_button)
+
+    def open_game_folder(self):
+        folder_path = ""
+        if self.config.get("game_path"):
+            folder_path = os.path.dirname(self.config["game_path"])
+        elif os.path.exists(YAN_SIM_INSTALL_PATH):
+            folder_path = YAN_SIM_INSTALL_PATH
+        
+        if folder_path and os.path.isdir(folder_path):
+            if IS_WINDOWS:
+                os.startfile(folder_path)
+            else:
+                subprocess.run(['xdg-open', folder_path])
+        else:
+            QMessageBox.warning(self, self.lang_data["error_title"], self.lang_data["game_path_undefined"])
+
+    def apply_theme_to_settings_buttons(self):
+        theme = self.parent().get_current_theme_data()
+        button_style = f"""
+            QPushButton {{
+                color: {theme["button_text_color"]};
+                background-color: {theme["button_bg_color"]};
+                padding: 8px;
+                border-radius: 6px;
+                border: 1px solid {theme["border_color"]};
+                font-family: Jost;
+            }}
+            QPushButton:hover {{
+                background-color: {theme["button_hover_bg_color"]};
+            }}
+        """
+        self.apply_btn.setStyleSheet(button_style)
+        self.load_custom_theme_button.setStyleSheet(button_style)
+        if hasattr(self, 'select_exe_button'):
+            self.select_exe_button.setStyleSheet(button_style)
+        if hasattr(self, 'wineprefix_button'):
+            self.wineprefix_button.setStyleSheet(button_style)
+        if hasattr(self, 'open_folder_button'):
+            self.open_folder_button.setStyleSheet(button_style)
+
+    def update_theme_selector_items(self):
+        self.theme_selector.clear()
+        self.theme_selector.addItems(THEMES.keys())
+        self.theme_selector.addItems(self.parent().theme_registry.paths())
+
+    def load_custom_theme_file(self):
+        file, _ = QFileDialog.getOpenFileName(self, self.parent().lang["load_custom_theme"], CUSTOM_THEMES_DIR, "Yanix Theme Files (*.yltheme)")
+        if file:
+            theme_data = load_custom_theme(file, self.parent().lang)
+            if theme_data:
+                self.config["theme"] = file
+                self.update_theme_selector_items()
+                self.theme_selector.setCurrentText(file)
+                QMessageBox.information(self, self.parent().lang["success_title"], self.parent().lang["theme_changed"])
+                if self.parent():
+                    self.parent().config = self.config
+                    self.parent().apply_theme(self.config["theme"])
+                    self.apply_theme_to_settings_buttons()
+
+    def apply_settings(self):
+        new_lang = self.lang_selector.currentText()
+        self.config["language"] = new_lang
+        self.config["theme"] = self.theme_selector.currentText()
+        
+        advanced_message = ""
+        if self.config["advanced_mode"]:
+            self.config["blog_link"] = self.blog_link_edit.text()
+            self.config["lite_news"] = self.lite_news_checkbox.isChecked()
+            self.config["low_footprint_tray"] = self.low_footprint_tray_checkbox.isChecked()
+            self.config["discord_rpc"] = self.discord_rpc_checkbox.isChecked()
+            self.config["launch_command"] = self.launch_command_edit.text()
+            self.config["stream_install"] = self.stream_install_checkbox.isChecked()
+            if not IS_WINDOWS:
+                self.config["gamemode"] = self.gamemode_checkbox.isChecked()
+                self.config["fsr"] = self.fsr_checkbox.isChecked()
+            advanced_message = f'\n\n{LANGUAGES[new_lang]["advanced_settings_applied"]}'
+
+        save_config(self.config)
+        
+        if self.parent():
+            self.parent().reload_config()
+
+        message = LANGUAGES[new_lang]["lang_changed"]
+        if new_lang not in ["en", "pt", "ndk"]:
+            message += f'\n\n{LANGUAGES[new_lang]["lang_ai_warning"]}'
+        
+        if not advanced_message:
+            QMessageBox.information(self, LANGUAGES[new_lang]["info_title"], message)
+        else:
+            QMessageBox.information(self, LANGUAGES[new_lang]["info_title"], message + advanced_message)
+            
+        self.accept()
+
+class DownloadWorker(QObject):
+    finished = pyqtSignal()
+    error = pyqtSignal(str, str)
+    extraction_started = pyqtSignal()
+    extraction_finished = pyqtSignal()
+
+    def __init__(self, url, install_path, lang_data, progress, stream_install=False, buffer_size=DOWNLOAD_BUFFER_SIZE):
+        super().__init__()
+        self.url = url
+        self.install_path = install_path
+        self.lang = lang_data
+        self.progress = progress
+        self.stream_install = stream_install
+        self.buffer_size = buffer_size
+        self._is_running = True
+
+    def report_progress(self, downloaded_size, total_size):
+        self.progress.update("download", downloaded_size, total_size)
+
+    def report_extraction(self, extracted_bytes, total_bytes):
+        self.progress.update("extract", extracted_bytes, total_bytes)
+
+    def install_streamed(self):
+        staging_path = self.install_path + ".partial"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        try:
+            stream_install(self.url, staging_path, self.report_progress, lambda: self._is_running)
+        except InterruptedError:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise InterruptedError(self.lang["download_canceled"])
+        except StreamingZipError as e:
+            print(f"Streaming install unavailable, falling back to a regular download: {e}")
+            shutil.rmtree(staging_path, ignore_errors=True)
+            return False
+        except BaseException:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+
+        previous_path = self.install_path + ".old"
+        shutil.rmtree(previous_path, ignore_errors=True)
+        if os.path.exists(self.install_path):
+            os.replace(self.install_path, previous_path)
+        os.replace(staging_path, self.install_path)
+        shutil.rmtree(previous_path, ignore_errors=True)
+        return True
+
+    def run(self):
+        try:
+            streamed = self.stream_install and not archive_cache.lookup(self.url) and self.install_streamed()
+            if not streamed:
+                try:
+                    archive_path = archive_cache.fetch(self.url, self.report_progress, lambda: self._is_running,
+                                                       connections=DOWNLOAD_CONNECTIONS, buffer_size=self.buffer_size)
+                except InterruptedError:
+                    raise InterruptedError(self.lang["download_canceled"])
+
+                self.extraction_started.emit()
+                try:
+                    extract_archive(archive_path, self.install_path, self.report_extraction, flatten=True)
+                except Exception:
+                    archive_cache.discard(self.url)
+                    raise
+
+            self.extraction_finished.emit()
+
+        except InterruptedError as e:
+            self.error.emit("canceled", str(e))
+        except Exception as e:
+            self.error.emit("error_title", self.lang["unexpected_error"].format(e=e))
+        finally:
+            self.finished.emit()
+
+    def stop(self):
+        self._is_running = False
+
+class YanixLauncher(QMainWindow):
+    game_finished = pyqtSignal()
+    pad_mode_finished = pyqtSignal()
+    update_checker_signals = UpdateCheckerSignals()
+    environment_signals = EnvironmentSignals()
+
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        self.lang_code = self.config["language"]
+        self.lang = LANGUAGES.get(self.lang_code, LANGUAGES["en"])
+        self.current_launcher_version = __version__
+        self.is_game_running = False
+        self.low_footprint = False
+        self.loaded_blog_link = None
+        self.theme_engine = ThemeEngine()
+        self.theme_registry = ThemeRegistry(CUSTOM_THEMES_DIR, self)
+        self.theme_registry.theme_changed.connect(self._on_custom_theme_changed)
+        self.theme_registry.theme_error.connect(self._on_theme_error, Qt.ConnectionType.QueuedConnection)
+        self.applied_theme_key = None
+        self.applied_background_key = None
+        connectivity.refresh(YAN_SIM_DOWNLOAD_URL)
+
+        self.setWindowTitle("Yanix Launcher")
+        self.setFixedSize(*WINDOW_SIZE)
+
+        if os.path.exists(ICON_PATH):
+            self.setWindowIcon(QIcon(ICON_PATH))
+
+        self.init_tray()
+
+        self.rpc = None
+        self.start_time = int(time.time())
+        if self.config.get("discord_rpc", True):
+            self.init_rpc()
+
+        with startup_profiler.phase("setup_ui"):
+            self.setup_ui()
+            self.retranslate_ui()
+        with startup_profiler.phase("apply_theme"):
+            self.apply_theme(self.config["theme"])
+        self.game_finished.connect(self._on_game_finished)
+        self.pad_mode_finished.connect(self._on_pad_mode_finished)
+        self.update_checker_signals.update_status.connect(self._on_update_check_result)
+        self.update_checker_signals.update_found.connect(self._on_update_found)
+        self.environment_signals.wine_outdated.connect(self._on_wine_outdated)
+        self.environment_signals.software_rendering.connect(self._on_software_rendering)
+        self.check_environment()
+
+    def init_tray(self):
+        self.tray_icon = QSystemTrayIcon(self)
+        if os.path.exists(ICON_PATH):
+            self.tray_icon.setIcon(QIcon(ICON_PATH))
+        
+        tray_menu = QMenu()
+        show_action = QAction("Show Launcher", self)
+        show_action.triggered.connect(self.restore_from_tray)
+        quit_action = QAction("Exit", self)
+        quit_action.triggered.connect(QApplication.instance().quit)
+        
+        tray_menu.addAction(show_action)
+        tray_menu.addAction(quit_action)
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(lambda reason: self.restore_from_tray() if reason == QSystemTrayIcon.ActivationReason.Trigger else None)
+        self.tray_icon.show()
+
+    def restore_from_tray(self):
+        self.showNormal()
+        self.activateWindow()
+        if not self.is_game_running:
+            self.update_rpc(details="In the launcher", state="Browsing...")
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_F6 and event.modifiers() == Qt.KeyboardModifier.ShiftModifier:
+            self.config["advanced_mode"] = not self.config["advanced_mode"]
+            save_config(self.config)
+            state = "enabled" if self.config["advanced_mode"] else "disabled"
+            QMessageBox.information(self, "Advanced Mode", f"Advanced mode will be {state} on next restart.")
+        else:
+            super().keyPressEvent(event)
+
+    def init_rpc(self):
+        try:
+            presence_class = load_presence()
+            if presence_class is None:
+                self.rpc = None
+                return
+            self.rpc = presence_class(CLIENT_ID)
+            self.rpc.connect()
+            self.update_rpc(details="In the launcher", state="Browsing...")
+        except Exception:
+            self.rpc = None
+
+    def update_rpc(self, details, state=None):
+        if not self.config.get("discord_rpc", True):
+            return
+        if not self.rpc:
+            self.init_rpc()
+        
+        if self.rpc:
+            try:
+                self.rpc.update(
+                    details=details,
+                    state=state,
+                    start=self.start_time,
+                    large_image="yanix_logo",
+                    large_text="Yanix Launcher"
+                )
+            except Exception:
+                self.rpc = None
+
+    def on_startup_assets_ready(self):
+        self.theme_engine.clear()
+        self.applied_theme_key = None
+        self.applied_background_key = None
+        self.apply_theme(self.config["theme"])
+
+    def reload_config(self):
+        self.config = load_config()
+        self.retranslate_ui()
+        if isinstance(self.blog_view, NewsPanel) != self.config.get("lite_news", False):
+            blog_view = self.create_blog_view()
+            self.main_layout.replaceWidget(self.blog_view, blog_view)
+            self.blog_view.deleteLater()
+            self.blog_view = blog_view
+            self.loaded_blog_link = None
+            self.applied_theme_key = None
+            self.apply_theme(self.config["theme"])
+        self.load_blog()
+
+    def check_environment(self):
+        if IS_WINDOWS:
+            return
+        environment_worker = EnvironmentProber(self.environment_signals)
+        threading.Thread(target=environment_worker.run, name="environment-probe", daemon=True).start()
+
+    def _on_wine_outdated(self, detected_version):
+        title = self.lang.get("wine_version_warning_title", "WINE Version Warning")
+        body = self.lang.get("wine_version_warning_body", "Your WINE version ({version}) is older than 8.0...").format(version=detected_version)
+        QMessageBox.warning(self, title, body)
+
+    def _on_software_rendering(self):
+        QMessageBox.warning(self, self.lang.get("vm_warning_title", "VM Warning"), self.lang.get("vm_warning_body", "No 3D acceleration detected."))
+
+    def get_current_theme_data(self):
+        theme_name = self.config["theme"]
+        if theme_name.endswith(".yltheme"):
+            theme_data = self.theme_registry.get(theme_name)
+            if theme_data:
+                return theme_data
+        return THEMES.get(theme_name, THEMES["dragon-red"])
+
+    def _on_custom_theme_changed(self, path):
+        if path == self.config["theme"]:
+            self.apply_theme(path)
+
+    def _on_theme_error(self, path, error):
+        QMessageBox.critical(self, self.lang["theme_error_title"], self.lang["theme_load_error"].format(filepath=path, e=error))
+
+    def theme_cache_key(self, theme_name):
+        if theme_name.endswith(".yltheme"):
+            try:
+                stat = os.stat(theme_name)
+                return (theme_name, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return (theme_name,)
+
+    def apply_theme(self, theme_name):
+        key = self.theme_cache_key(theme_name)
+        compiled = self.theme_engine.compile(key, self.get_current_theme_data)
+
+        if key != self.applied_theme_key:
+            for button in [self.play_button, self.settings_button,
+                           self.download_button, self.pad_mode_button, self.winetricks_button,
+                           self.check_updates_button,
+                           self.support_button, self.discord_button, self.credits_button]:
+                button.setStyleSheet(compiled.button_style)
+            self.version_label.setStyleSheet(compiled.label_style)
+            self.blog_view.setStyleSheet(compiled.blog_view_style)
+            self.applied_theme_key = key
+
+        ratio = self.devicePixelRatioF()
+        background_key = (key, self.width(), self.height(), ratio)
+        if background_key != self.applied_background_key:
+            palette = self.palette()
+            palette.setBrush(QPalette.ColorRole.Window, self.theme_engine.background_brush(key, compiled, self.size(), ratio))
+            self.setPalette(palette)
+            self.applied_background_key = background_key
+
+    def suspend_blog_view(self):
+        if isinstance(self.blog_view, NewsPanel):
+            self.blog_view.clear()
+            self.loaded_blog_link = None
+            return
+        from PyQt6.QtWebEngineCore import QWebEnginePage
+        self.blog_view.page().setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+
+    def resume_blog_view(self):
+        if isinstance(self.blog_view, NewsPanel):
+            self.load_blog()
+            return
+        from PyQt6.QtWebEngineCore import QWebEnginePage
+        self.blog_view.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def enter_low_footprint_mode(self):
+        if self.low_footprint or not self.config.get("low_footprint_tray", True):
+            return
+        self.low_footprint = True
+        self.suspend_blog_view()
+        self.theme_engine.clear()
+        palette = self.palette()
+        palette.setBrush(QPalette.ColorRole.Window, QBrush())
+        self.setPalette(palette)
+        self.applied_background_key = None
+        trim_process_memory()
+
+    def exit_low_footprint_mode(self):
+        if not self.low_footprint:
+            return
+        self.low_footprint = False
+        self.apply_theme(self.config["theme"])
+        QTimer.singleShot(0, self.resume_blog_view)
+
+    def showEvent(self, event):
+        self.exit_low_footprint_mode()
+        if self.loaded_blog_link is None:
+            QTimer.singleShot(0, self.load_blog)
+        super().showEvent(event)
+
+    def resizeEvent(self, event):
+        self.apply_theme(self.config["theme"])
+        super().resizeEvent(event)
+
+    def _on_game_finished(self):
+        self.is_game_running = False
+        self.show()
+        self.update_rpc(details="In the launcher", state="Browsing...")
+
+    def _wait_for_game_exit(self, process):
+        process.wait()
+        self.game_finished.emit()
+
+    def _on_pad_mode_finished(self):
+        self.show()
+
+    def _wait_for_pad_mode_exit(self, process):
+        process.wait()
+        self.pad_mode_finished.emit()
+
+    def launch_game(self):
+        wine_path_exe = resolve_game_executable(self.config)
+        if not wine_path_exe:
+            QMessageBox.critical(self, self.lang["error_title"], self.lang["game_path_undefined"])
+            return
+
+        game_dir = os.path.dirname(wine_path_exe)
+        final_command = build_game_command(self.config, wine_path_exe)
+
+        if not final_command:
+            QMessageBox.critical(self, self.lang["error_title"], self.lang["game_path_undefined"])
+            return
+
+        try:
+            env = build_game_env(self.config)
+
+            self.is_game_running = True
+            self.hide()
+            self.enter_low_footprint_mode()
+            self.tray_icon.showMessage("Yanix Launcher", "Game running... Launcher minimized to tray.", QSystemTrayIcon.MessageIcon.Information, 3000)
+            
+            self.update_rpc(details="Playing Yandere Simulator", state="In-Game")
+
+            process = subprocess.Popen(final_command, cwd=game_dir, env=env)
+
+            monitor_thread = threading.Thread(
+                target=self._wait_for_game_exit,
+                args=(process,),
+                daemon=True
+            )
+            monitor_thread.start()
+
+        except Exception as e:
+            self.is_game_running = False
+            QMessageBox.critical(self, self.lang["error_title"], self.lang["game_launch_fail"].format(e=e))
+            self.show()
+            self.update_rpc(details="In the launcher", state="Browsing...")
+
+    def launch_pad_mode(self):
+        if not os.path.exists(PADMODE_SCRIPT_PATH):
+             msg = self.lang["pad_mode_not_found"].format(path=PADMODE_SCRIPT_PATH)
+             QMessageBox.information(self, self.lang["info_title"], msg)
+             try:
+                 response = get_http_session().get(PADMODE_DOWNLOAD_URL, timeout=HTTP_TIMEOUT)
+                 response.raise_for_status()
+                 with open(PADMODE_SCRIPT_PATH, 'wb') as f:
+                     f.write(response.content)
+             except Exception as e:
+                 QMessageBox.critical(self, self.lang["error_title"], f"Failed to download Pad Mode: {e}")
+                 return
+
+        if os.path.exists(PADMODE_SCRIPT_PATH):
+            try:
+                self.hide()
+                self.enter_low_footprint_mode()
+                process = subprocess.Popen([sys.executable, PADMODE_SCRIPT_PATH])
+                monitor_thread = threading.Thread(
+                    target=self._wait_for_pad_mode_exit,
+                    args=(process,),
+                    daemon=True
+                )
+                monitor_thread.start()
+            except Exception as e:
+                self.show()
+                QMessageBox.critical(self, self.lang["error_title"], f"Failed to launch Pad Mode: {e}")
+
+    def select_exe(self):
+        file, _ = QFileDialog.getOpenFileName(self, self.lang["select_exe_window_title"], "", self.lang["exe_file_filter"])
+        if file:
+            self.config["game_path"] = file
+            save_config(self.config)
+            QMessageBox.information(self, self.lang["success_title"], self.lang["exe_save_success"])
+
+    def select_wineprefix(self):
+        if IS_WINDOWS:
+            return
+        directory = QFileDialog.getExistingDirectory(self, self.lang["wineprefix"])
+        if directory:
+            self.config["wine_prefix"] = directory
+            save_config(self.config)
+            QMessageBox.information(self, self.lang["success_title"], self.lang["wineprefix_selected"])
+
+    def download_game(self):
+        if connectivity.is_online(YAN_SIM_DOWNLOAD_URL, wait=False) is False:
+            QMessageBox.critical(self, self.lang["no_internet_title"], self.lang["no_internet"])
+            return
+
+        should_download = False
+
+        if os.path.exists(YAN_SIM_INSTALL_PATH):
+            reply = QMessageBox.question(self, self.lang["download_game_window_title"],
+                                         self.lang["redownload_game_confirm"],
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+            if reply == QMessageBox.StandardButton.Yes:
+                try:
+                    shutil.rmtree(YAN_SIM_INSTALL_PATH)
+                    self.config["game_path"] = ""
+                    save_config(self.config)
+                    should_download = True
+                except Exception as e:
+                    QMessageBox.critical(self, self.lang["error_title"], self.lang["game_delete_fail"].format(e=e))
+                    return
+            else:
+                return
+        else:
+            reply = QMessageBox.question(self, self.lang["download_game_window_title"],
+                                         self.lang["download_game_prompt"],
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+            if reply == QMessageBox.StandardButton.Yes:
+                should_download = True
+            else:
+                return
+
+        if not should_download:
+            return
+
+        self.progress_dialog = QProgressDialog(self.lang.get("connecting", "Connecting..."), self.lang.get("cancel", "Cancel"), 0, 100, self)
+        self.progress_dialog.setWindowTitle(self.lang["download_progress_window_title"])
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress_dialog.setFixedSize(self.progress_dialog.size())
+
+        self.download_progress = ProgressTracker()
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_REFRESH_MS)
+        self.progress_timer.timeout.connect(self.refresh_download_progress)
+
+        self.thread = QThread()
+        self.worker = DownloadWorker(YAN_SIM_DOWNLOAD_URL, YAN_SIM_INSTALL_PATH, self.lang, self.download_progress,
+                                     self.config.get("stream_install", False),
+                                     self.config.get("download_buffer_size", DOWNLOAD_BUFFER_SIZE))
+        self.worker.moveToThread(self.thread)
+
+        self.progress_dialog.canceled.connect(self.cancel_download)
+        self.thread.started.connect(self.worker.run)
+        self.worker.finished.connect(self.thread.quit)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.finished.connect(self.progress_timer.stop)
+        self.thread.finished.connect(self.thread.deleteLater)
+        self.worker.error.connect(self.on_download_error)
+
+        self.worker.extraction_started.connect(self.start_extraction_progress)
+        self.worker.extraction_finished.connect(self.on_extraction_finished)
+
+        self.thread.start()
+        self.progress_timer.start()
+        self.progress_dialog.show()
+
+    def cancel_download(self):
+        if hasattr(self, 'worker'):
+            self.worker.stop()
+        if hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
+            self.progress_dialog.close()
+        if hasattr(self, 'extract_dialog') and self.extract_dialog.isVisible():
+            self.extract_dialog.close()
+
+    def refresh_download_progress(self):
+        snapshot = self.download_progress.snapshot()
+        percentage = int(snapshot["fraction"] * 100)
+        if snapshot["phase"] == "download":
+            downloaded_mb = f"{snapshot['done'] / (1024*1024):.2f}MB"
+            if snapshot["total"] > 0:
+                total_mb = f"{snapshot['total'] / (1024*1024):.2f}MB"
+                progress_text = self.lang["downloading_label"].format(downloaded=downloaded_mb, total=total_mb, percentage=percentage)
+            else:
+                progress_text = self.lang["downloading_label_no_total"].format(downloaded=downloaded_mb)
+            if snapshot["eta"] is not None:
+                progress_text += "\n" + self.lang.get("download_rate_label", "{rate}/s, {eta} remaining").format(
+                    rate=f"{snapshot['rate'] / (1024*1024):.2f}MB", eta=format_duration(snapshot["eta"]))
+            self.progress_dialog.setValue(percentage)
+            self.progress_dialog.setLabelText(progress_text)
+        elif snapshot["phase"] == "extract" and hasattr(self, 'extract_dialog') and self.extract_dialog.isVisible():
+            self.extract_dialog.setValue(percentage)
+
+    def on_download_error(self, title_key, message):
+        if title_key == "canceled":
+            return
+        if hasattr(self, 'progress_dialog'):
+            self.progress_dialog.close()
+        if hasattr(self, 'extract_dialog'):
+            self.extract_dialog.close()
+        title = self.lang.get(title_key, self.lang["error_title"])
+        QMessageBox.critical(self, title, message)
+
+    def start_extraction_progress(self):
+        self.progress_dialog.close()
+        self.extract_dialog = QProgressDialog(self.lang["extracting_label"], self.lang.get("cancel", "Cancel"), 0, 100, self)
+        self.extract_dialog.setWindowTitle(self.lang["extraction_progress_window_title"])
+        self.extract_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.extract_dialog.setFixedSize(self.extract_dialog.size())
+        self.extract_dialog.canceled.connect(self.cancel_download)
+        self.extract_dialog.show()
+
+    def on_extraction_finished(self):
+        if hasattr(self, 'progress_dialog') and self.progress_dialog.isVisible():
+            self.progress_dialog.close()
+        if hasattr(self, 'extract_dialog'):
+            self.extract_dialog.close()
+        QMessageBox.information(self, self.lang["success_title"], self.lang["game_download_success"])
+
+    def manage_winetricks(self):
+        if IS_WINDOWS:
+            QMessageBox.information(self, "Info", "Winetricks is not needed on Windows.")
+            return
+        if not shutil.which("winetricks"):
+            QMessageBox.critical(self, self.lang["error_title"], self.lang["winetricks_missing"])
+        else:
+            try:
+                env = os.environ.copy()
+                if self.config.get("wine_prefix"):
+                    env["WINEPREFIX"] = self.config["wine_prefix"]
+                subprocess.Popen(["winetricks"], env=env)
+            except Exception as e:
+                QMessageBox.critical(self, self.lang["error_title"], self.lang["winetricks_launch_fail"].format(e=e))
+
+    def check_for_updates(self):
+        update_worker = UpdateChecker(self.current_launcher_version, self.lang, self.update_checker_signals)
+        threading.Thread(target=update_worker.run, daemon=True).start()
+
+    def _on_update_check_result(self, message):
+        QMessageBox.information(self, self.lang["check_updates"], message)
+
+    def _on_update_found(self, version):
+        reply = QMessageBox.question(self, self.lang["check_updates"],
+                                     self.lang["update_outdated"],
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.Yes)
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                activate_package_version(version)
+                QMessageBox.information(self, self.lang["check_updates"], self.lang["update_restart_prompt"])
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            except Exception as e:
+                QMessageBox.critical(self, self.lang["update_error_window_title"], self.lang["update_fail"].format(e=e))
+
+    def open_settings(self):
+        dlg = SettingsDialog(self.config, self.lang, self)
+        dlg.exec()
+
+    def show_credits(self):
+        credits_text = """
+Yanix Launcher Was Made by:
+Seyu's Stuff
+
+Volunteers:
+Ayovizzion, Ashxlek
+
+Supporters:
+Akashiraii, SlayAllDay2, Sara-chan
+
+Yanix Launcher™ Made by Yanix Launcher Community™, All Rights Reserved
+Yandere Simulator™ Made By YandereDev, All Rights Reserved
+"""
+        QMessageBox.information(self, self.lang["credits"], credits_text)
+
+    def closeEvent(self, event):
+        if self.rpc:
+            self.rpc.close()
+        event.accept()
+
+    def retranslate_ui(self):
+        self.lang_code = self.config["language"]
+        self.lang = LANGUAGES.get(self.lang_code, LANGUAGES["en"])
+
+        self.play_button.setText(self.lang["play"])
+        self.settings_button.setText(self.lang["settings"])
+        self.download_button.setText(self.lang["download"])
+        self.pad_mode_button.setText(self.lang["pad_mode"])
+        self.winetricks_button.setText(self.lang["winetricks"])
+        self.check_updates_button.setText(self.lang["check_updates"])
+        self.support_button.setText(self.lang["support"])
+        self.discord_button.setText(self.lang["discord"])
+        self.credits_button.setText(self.lang["credits"])
+        self.version_label.setText(f"{self.lang['welcome']} v{self.current_launcher_version} — Ferret ")
+        self.apply_theme(self.config["theme"])
+
+    def create_blog_view(self):
+        if self.config.get("lite_news", False):
+            return NewsPanel(self.lang)
+
+        with startup_profiler.phase("import_webengine"):
+            from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+        blog_view = QWebEngineView()
+        profile = QWebEngineProfile("yanix-blog-profile", blog_view)
+        profile.setHttpUserAgent(USER_AGENT)
+        profile.setPersistentStoragePath(os.path.join(BLOG_PROFILE_DIR, "storage"))
+        profile.setCachePath(os.path.join(BLOG_PROFILE_DIR, "cache"))
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        profile.setHttpCacheMaximumSize(BLOG_HTTP_CACHE_SIZE)
+        profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
+        page = QWebEnginePage(profile, blog_view)
+        blog_view.setPage(page)
+        return blog_view
+
+    def load_blog(self):
+        blog_link = self.config.get("blog_link", "https://yanix-launcher.blogspot.com")
+        if blog_link == self.loaded_blog_link:
+            return
+        self.loaded_blog_link = blog_link
+        self.blog_view.load(QUrl(blog_link))
+
+    def setup_ui(self):
+        main_layout = QHBoxLayout()
+        self.left_layout = QVBoxLayout()
+        self.left_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        font = QFont("Jost", 18)
+        version_font = QFont("Jost", 10)
+
+        self.play_button = QPushButton()
+        self.play_button.setFont(font)
+        self.play_button.clicked.connect(self.launch_game)
+        self.left_layout.addWidget(self.play_button)
+
+        self.settings_button = QPushButton()
+        self.settings_button.setFont(font)
+        self.settings_button.clicked.connect(self.open_settings)
+        self.left_layout.addWidget(self.settings_button)
+
+        self.download_button = QPushButton()
+        self.download_button.setFont(font)
+        self.download_button.clicked.connect(self.download_game)
+        self.left_layout.addWidget(self.download_button)
+
+        self.pad_mode_button = QPushButton()
+        self.pad_mode_button.setFont(font)
+        self.pad_mode_button.clicked.connect(self.launch_pad_mode)
+        self.left_layout.addWidget(self.pad_mode_button)
+
+        self.winetricks_button = QPushButton()
+        self.winetricks_button.setFont(font)
+        self.winetricks_button.clicked.connect(self.manage_winetricks)
+        if not IS_WINDOWS:
+            self.left_layout.addWidget(self.winetricks_button)
+
+        self.check_updates_button = QPushButton()
+        self.check_updates_button.setFont(font)
+        self.check_updates_button.clicked.connect(self.check_for_updates)
+        self.left_layout.addWidget(self.check_updates_button)
+
+        self.support_button = QPushButton()
+        self.support_button.setFont(font)
+        self.support_button.clicked.connect(lambda: webbrowser.open("https://gitea.com/YanixLauncher/Yanix-Launcher-Gitea/issues"))
+        self.left_layout.addWidget(self.support_button)
+
+        self.discord_button = QPushButton()
+        self.discord_button.setFont(font)
+        self.discord_button.clicked.connect(lambda: webbrowser.open("https://discord.gg/7JC4FGn69U"))
+        self.left_layout.addWidget(self.discord_button)
+
+        self.credits_button = QPushButton()
+        self.credits_button.setFont(font)
+        self.credits_button.clicked.connect(self.show_credits)
+        self.left_layout.addWidget(self.credits_button)
+
+        self.version_label = QLabel()
+        self.version_label.setFont(version_font)
+        self.left_layout.addWidget(self.version_label)
+
+        self.blog_view = self.create_blog_view()
+        startup_profiler.begin("blog_first_load")
+
+        main_layout.addLayout(self.left_layout, 1)
+        main_layout.addWidget(self.blog_view, 2)
+        self.main_layout = main_layout
+
+        container = QWidget()
+        container.setLayout(main_layout)
+        self.setCentralWidget(container)
+
+
+def main():
+    if IS_MACOS:
+        app = QApplication(sys.argv)
+        QMessageBox.critical(None, "macOS Detected", "macOS and Apple Silicon are unsupported. Use a Linux distribution. FEX may be used as an alternative on Apple hardware with Asahi Linux")
+        sys.exit(1)
+
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
+    with startup_profiler.phase("create_application"):
+        app = QApplication(sys.argv)
+    with startup_profiler.phase("add_application_font"):
+        QFontDatabase.addApplicationFont(JOST_FONT_PATH)
+
+    app_config = load_config()
+    is_first_run_flag = app_config.get("first_run", True)
+    with startup_profiler.phase("handle_first_run"):
+        handle_first_run(app_config)
+    
+    current_lang_data = LANGUAGES.get(app_config["language"], LANGUAGES["en"])
+
+    with startup_profiler.phase("show_splash"):
+        splash = YanixSplashScreen(current_lang_data)
+        splash.show()
+
+    signals = DownloadSignals()
+    signals.download_failed.connect(lambda msg: QMessageBox.critical(None, current_lang_data["download_failed"], msg))
+    signals.extraction_failed.connect(lambda msg: QMessageBox.critical(None, current_lang_data["extract_failed"], msg))
+    
+    startup_worker = StartupWorker(current_lang_data, signals, app_config, is_first_run_flag)
+    
+    def handle_install_prompt():
+        reply = QMessageBox.question(None, current_lang_data.get("install_deps_title", "Install Dependencies"), 
+                                     current_lang_data.get("install_deps_prompt", "Do you want to install DXVK and Corefonts?"),
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        startup_worker.should_install = (reply == QMessageBox.StandardButton.Yes)
+        startup_worker.install_event.set()
+
+    signals.ask_install.connect(handle_install_prompt)
+
+    startup_thread = threading.Thread(target=startup_worker.run, name="startup", daemon=True)
+
+    splash_timer = QTimer()
+    splash_timer.timeout.connect(lambda: splash.refresh_progress(startup_worker.progress))
+    splash_timer.start(PROGRESS_REFRESH_MS)
+
+    launcher = None
+
+    def show_launcher():
+        nonlocal launcher
+        splash_timer.stop()
+        splash.update_splash_content(current_lang_data["download_success"])
+        with startup_profiler.phase("create_launcher"):
+            launcher = YanixLauncher(app_config)
+            launcher.show()
+        splash.finish(launcher)
+        if startup_profiler.enabled:
+            launcher.blog_view.loadFinished.connect(finish_startup_profile)
+
+    def finish_startup_profile(ok):
+        startup_profiler.end("blog_first_load")
+        startup_profiler.report()
+
+    def on_startup_complete():
+        if launcher:
+            launcher.on_startup_assets_ready()
+
+    signals.data_ready.connect(show_launcher)
+    signals.download_complete.connect(on_startup_complete)
+
+    startup_thread.start()
+
+    exit_code = app.exec()
+    startup_profiler.report()
+    sys.exit(exit_code)